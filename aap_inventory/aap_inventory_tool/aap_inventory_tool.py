@@ -10,67 +10,100 @@ across growth and enterprise topologies.
 import argparse
 import sys
 import configparser
-import re
+import io
+import string
 import ipaddress
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple
 
+# Characters allowed in a hostname (labels separated by dots)
+HOSTNAME_CHARS = frozenset(string.ascii_letters + string.digits + '-.')
+
 
 class InventoryProcessor:
     """Base class for processing AAP inventory files."""
 
+    # Define required sections for each platform/topology combination
+    REQUIRED_SECTIONS = {
+        'containerized': {
+            'growth': ['automationgateway', 'automationcontroller', 'automationhub', 'automationeda', 'database'],
+            'enterprise': ['automationgateway', 'automationcontroller', 'automationhub', 'automationeda',
+                           'execution_nodes', 'redis']
+        },
+        'rpm': {
+            'growth': ['automationgateway', 'automationcontroller', 'execution_nodes', 'automationhub',
+                       'automationedacontroller', 'database'],
+            'enterprise': ['automationgateway', 'automationcontroller', 'execution_nodes', 'automationhub',
+                           'automationedacontroller', 'redis']
+        }
+    }
+
+    # Define required variables for each platform
+    REQUIRED_VARS = {
+        'containerized': {
+            'common': ['postgresql_admin_password'],
+            'gateway': ['gateway_admin_password', 'gateway_pg_host', 'gateway_pg_password'],
+            'controller': ['controller_admin_password', 'controller_pg_host', 'controller_pg_password'],
+            'hub': ['hub_admin_password', 'hub_pg_host', 'hub_pg_password'],
+            'eda': ['eda_admin_password', 'eda_pg_host', 'eda_pg_password']
+        },
+        'rpm': {
+            'common': [],
+            'gateway': ['automationgateway_admin_password', 'automationgateway_pg_host',
+                        'automationgateway_pg_password'],
+            'controller': ['admin_password', 'pg_host', 'pg_password'],
+            'hub': ['automationhub_admin_password', 'automationhub_pg_host', 'automationhub_pg_password'],
+            'eda': ['automationedacontroller_admin_password', 'automationedacontroller_pg_host',
+                    'automationedacontroller_pg_password']
+        }
+    }
+
+    # Password variables for each platform, collected once from all components of REQUIRED_VARS
+    PASSWORD_VARS = {
+        platform: tuple(var for component_vars in platform_vars.values()
+                        for var in component_vars if 'password' in var.lower())
+        for platform, platform_vars in REQUIRED_VARS.items()
+    }
+
     def __init__(self, platform: str = None, topology: str = None):
         self.platform = platform
         self.topology = topology
-        self.errors = []
-        self.warnings = []
+        self.reset()
 
-        # Define required sections for each platform/topology combination
-        self.required_sections = {
-            'containerized': {
-                'growth': ['automationgateway', 'automationcontroller', 'automationhub', 'automationeda', 'database'],
-                'enterprise': ['automationgateway', 'automationcontroller', 'automationhub', 'automationeda',
-                               'execution_nodes', 'redis']
-            },
-            'rpm': {
-                'growth': ['automationgateway', 'automationcontroller', 'execution_nodes', 'automationhub',
-                           'automationedacontroller', 'database'],
-                'enterprise': ['automationgateway', 'automationcontroller', 'execution_nodes', 'automationhub',
-                               'automationedacontroller', 'redis']
-            }
-        }
+    def reset(self):
+        """Clear errors, warnings and warning codes so the processor can be reused.
 
-        # Define required variables for each platform
-        self.required_vars = {
-            'containerized': {
-                'common': ['postgresql_admin_password'],
-                'gateway': ['gateway_admin_password', 'gateway_pg_host', 'gateway_pg_password'],
-                'controller': ['controller_admin_password', 'controller_pg_host', 'controller_pg_password'],
-                'hub': ['hub_admin_password', 'hub_pg_host', 'hub_pg_password'],
-                'eda': ['eda_admin_password', 'eda_pg_host', 'eda_pg_password']
-            },
-            'rpm': {
-                'common': [],
-                'gateway': ['automationgateway_admin_password', 'automationgateway_pg_host',
-                            'automationgateway_pg_password'],
-                'controller': ['admin_password', 'pg_host', 'pg_password'],
-                'hub': ['automationhub_admin_password', 'automationhub_pg_host', 'automationhub_pg_password'],
-                'eda': ['automationedacontroller_admin_password', 'automationedacontroller_pg_host',
-                        'automationedacontroller_pg_password']
-            }
-        }
+        Fresh containers are created, so results returned earlier by get_results are left intact.
+        """
+        self.errors = []
+        self.warnings = []
+        # Short machine-readable codes for warnings that callers may want to check for
+        self.warning_codes = set()
 
     def parse_inventory(self, inventory_path: str) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
         """Parse inventory file and return sections and variables."""
-        # Check if file exists first
-        if not Path(inventory_path).exists():
+        # Open the file directly rather than checking for existence first (one syscall instead of two)
+        try:
+            with open(inventory_path) as inventory_file:
+                config = configparser.ConfigParser(allow_no_value=True)
+                config.read_file(inventory_file)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Inventory file not found: {inventory_path}")
+        except Exception as e:
+            raise Exception(f"Error parsing inventory file: {e}")
+
+        sections = self._extract_sections(config)
+        variables = self._extract_variables(config)
+
+        return sections, variables
 
+    def parse_inventory_string(self, content: str) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+        """Parse inventory content held in memory and return sections and variables."""
         try:
             config = configparser.ConfigParser(allow_no_value=True)
-            config.read(inventory_path)
+            config.read_string(content)
         except Exception as e:
-            raise Exception(f"Error parsing inventory file: {e}")
+            raise Exception(f"Error parsing inventory content: {e}")
 
         sections = self._extract_sections(config)
         variables = self._extract_variables(config)
@@ -111,10 +144,15 @@ class InventoryProcessor:
         return variables
 
     def get_results(self) -> Dict[str, List[str]]:
-        """Get processing results."""
+        """Get processing results.
+
+        The returned collections are the processor's own errors, warnings and
+        warning codes, not copies.
+        """
         return {
             'errors': self.errors,
-            'warnings': self.warnings
+            'warnings': self.warnings,
+            'warning_codes': self.warning_codes
         }
 
 
@@ -152,12 +190,16 @@ class InventoryValidator(InventoryProcessor):
         if hostname.endswith('.'):
             hostname = hostname[:-1]
 
+        # Only letters, digits, dashes and dots are allowed
+        if not HOSTNAME_CHARS.issuperset(hostname):
+            return False
+
         # Check each label in the hostname
         labels = hostname.split('.')
         for label in labels:
             if not label or len(label) > 63:
                 return False
-            if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$', label):
+            if label[0] == '-' or label[-1] == '-':
                 return False
 
         return True
@@ -206,7 +248,7 @@ class InventoryValidator(InventoryProcessor):
             self.warnings.append("Platform and topology not specified, skipping section validation")
             return
 
-        required = self.required_sections[self.platform][self.topology]
+        required = self.REQUIRED_SECTIONS[self.platform][self.topology]
 
         for section in required:
             if section not in sections:
@@ -220,7 +262,7 @@ class InventoryValidator(InventoryProcessor):
             self.warnings.append("Platform not specified, skipping variable validation")
             return
 
-        required_vars = self.required_vars[self.platform]
+        required_vars = self.REQUIRED_VARS[self.platform]
 
         # Check common variables
         for var in required_vars['common']:
@@ -229,10 +271,9 @@ class InventoryValidator(InventoryProcessor):
 
         # Check component-specific variables
         for component in ['gateway', 'controller', 'hub', 'eda']:
-            if component in required_vars:
-                for var in required_vars[component]:
-                    if var not in variables:
-                        self.errors.append(f"Missing required {component} variable: {var}")
+            for var in required_vars.get(component, ()):
+                if var not in variables:
+                    self.errors.append(f"Missing required {component} variable: {var}")
 
         # Validate password variables specifically
         self._validate_password_variables(variables)
@@ -245,22 +286,18 @@ class InventoryValidator(InventoryProcessor):
         if not self.platform:
             return
 
-        required_vars = self.required_vars[self.platform]
-        password_vars = []
-
-        # Collect all password variables from all components
-        for component_vars in required_vars.values():
-            if isinstance(component_vars, list):
-                password_vars.extend([var for var in component_vars if 'password' in var.lower()])
-
-        for var in password_vars:
+        for var in self.PASSWORD_VARS[self.platform]:
             if var not in variables:
                 self.errors.append(f"Missing required password variable: {var}")
-            elif not variables[var] or variables[var].strip() == '':
+                continue
+
+            value = variables[var]
+            if not value or not value.strip():
                 self.errors.append(f"Password variable '{var}' is empty")
-            elif self._is_variable_placeholder(variables[var]):
+            elif self._is_variable_placeholder(value):
                 # Allow parameterized variables but warn about them
-                self.warnings.append(f"Password variable '{var}' appears to be parameterized: {variables[var]}")
+                self.warnings.append(f"Password variable '{var}' appears to be parameterized: {value}")
+                self.warning_codes.add('TEMPLATED_PASSWORD')
 
     def _is_variable_placeholder(self, value: str) -> bool:
         """Check if a variable value is a placeholder/template."""
@@ -464,6 +501,40 @@ class InventoryComparator(InventoryProcessor):
 class InventoryGenerator(InventoryProcessor):
     """Generates AAP inventory files based on platform and topology."""
 
+    # Hub signing parameters mapped to (inventory variable name, default value) per platform
+    HUB_SIGNING_VAR_MAPPING = {
+        'rpm': {
+            'hub_signing_auto_sign': ('automationhub_auto_sign_collections', 'true'),
+            'hub_signing_require_content_approval': ('automationhub_require_content_approval', 'true'),
+            'hub_signing_collection_key': ('automationhub_collection_signing_key', None),
+            'hub_signing_collection_pass': ('automationhub_collection_signing_pass', None),
+            'hub_signing_container_key': ('automationhub_container_signing_key', None),
+            'hub_signing_container_pass': ('automationhub_container_signing_pass', None)
+        },
+        'containerized': {
+            'hub_signing_auto_sign': ('hub_auto_sign_collections', 'true'),
+            'hub_signing_require_content_approval': ('hub_require_content_approval', 'true'),
+            'hub_signing_collection_key': ('hub_collection_signing_key', None),
+            'hub_signing_collection_pass': ('hub_collection_signing_pass', None),
+            'hub_signing_container_key': ('hub_container_signing_key', None),
+            'hub_signing_container_pass': ('hub_container_signing_pass', None)
+        }
+    }
+
+    # Custom CA cert parameters mapped to (inventory variable name, default value) per platform
+    CA_CERT_VAR_MAPPING = {
+        'rpm': {
+            'custom_ca_cert': ('custom_ca_cert', None),
+            'ca_tls_cert': ('aap_ca_cert_file', None),
+            'ca_tls_key': ('aap_ca_key_file', None)
+        },
+        'containerized': {
+            'custom_ca_cert': ('custom_ca_cert', None),
+            'ca_tls_cert': ('ca_tls_cert', None),
+            'ca_tls_key': ('ca_tls_key', None)
+        }
+    }
+
     def generate_inventory(self, output_path: str, output_type: str = 'file', host: str = None, **kwargs) -> bool:
         """Generate inventory file based on platform and topology."""
         if not self.platform or not self.topology:
@@ -482,6 +553,16 @@ class InventoryGenerator(InventoryProcessor):
             self.errors.append(f"Generation for {self.platform} {self.topology} is not yet implemented")
             return False
 
+    def build_inventory_string(self, host: str = None, **kwargs) -> Optional[str]:
+        """Generate inventory content and return it instead of writing it out.
+
+        Returns None if generation fails; the reason is recorded in errors.
+        """
+        buffer = io.StringIO()
+        if not self.generate_inventory(buffer, 'stream', host, **kwargs):
+            return None
+        return buffer.getvalue()
+
     def _build_hub_signing_section(self, **kwargs) -> str:
         """Build hub signing variables section for inventory."""
         hub_signing_section = ""
@@ -490,25 +571,8 @@ class InventoryGenerator(InventoryProcessor):
             return hub_signing_section
 
         # Map hub signing parameters to inventory variable names based on platform
-        if self.platform == 'rpm':
-            var_mapping = {
-                'hub_signing_auto_sign': ('automationhub_auto_sign_collections', 'true'),
-                'hub_signing_require_content_approval': ('automationhub_require_content_approval', 'true'),
-                'hub_signing_collection_key': ('automationhub_collection_signing_key', None),
-                'hub_signing_collection_pass': ('automationhub_collection_signing_pass', None),
-                'hub_signing_container_key': ('automationhub_container_signing_key', None),
-                'hub_signing_container_pass': ('automationhub_container_signing_pass', None)
-            }
-        elif self.platform == 'containerized':
-            var_mapping = {
-                'hub_signing_auto_sign': ('hub_auto_sign_collections', 'true'),
-                'hub_signing_require_content_approval': ('hub_require_content_approval', 'true'),
-                'hub_signing_collection_key': ('hub_collection_signing_key', None),
-                'hub_signing_collection_pass': ('hub_collection_signing_pass', None),
-                'hub_signing_container_key': ('hub_container_signing_key', None),
-                'hub_signing_container_pass': ('hub_container_signing_pass', None)
-            }
-        else:
+        var_mapping = self.HUB_SIGNING_VAR_MAPPING.get(self.platform)
+        if var_mapping is None:
             return hub_signing_section
 
         # Check if any hub signing parameters were passed (even if empty)
@@ -556,19 +620,8 @@ class InventoryGenerator(InventoryProcessor):
             return ca_cert_section
 
         # Map CA cert parameters to inventory variable names based on platform
-        if self.platform == 'rpm':
-            var_mapping = {
-                'custom_ca_cert': ('custom_ca_cert', None),
-                'ca_tls_cert': ('aap_ca_cert_file', None),
-                'ca_tls_key': ('aap_ca_key_file', None)
-            }
-        elif self.platform == 'containerized':
-            var_mapping = {
-                'custom_ca_cert': ('custom_ca_cert', None),
-                'ca_tls_cert': ('ca_tls_cert', None),
-                'ca_tls_key': ('ca_tls_key', None)
-            }
-        else:
+        var_mapping = self.CA_CERT_VAR_MAPPING.get(self.platform)
+        if var_mapping is None:
             return ca_cert_section
 
         # Build the variables
@@ -710,13 +763,9 @@ eda_pg_password={{{{ eda_pg_password }}}}
             final_redis_hosts = gateway_hosts + hub_hosts + eda_hosts
 
         # Build execution nodes section with hop host and execution hosts
-        execution_section = ""
-        if hop_host:
-            execution_section = f"{hop_host} receptor_type='hop'"
-            if execution_hosts:
-                execution_section += f"\n{chr(10).join(execution_hosts)}"
-        elif execution_hosts:
-            execution_section = chr(10).join(execution_hosts)
+        execution_entries = [f"{hop_host} receptor_type='hop'"] if hop_host else []
+        execution_entries.extend(execution_hosts)
+        execution_section = chr(10).join(execution_entries)
 
         # Build custom CA cert section if provided
         ca_cert_section = self._build_ca_cert_section(**kwargs)
@@ -910,9 +959,7 @@ automationedacontroller_pg_password={{{{ automationedacontroller_pg_password }}}
         hub_signing_section = self._build_hub_signing_section(**kwargs)
 
         # Build execution nodes section with hop host and execution hosts
-        execution_section = f"{hop_host} node_type='hop'"
-        if execution_hosts:
-            execution_section += f"\n{chr(10).join(execution_hosts)}"
+        execution_section = chr(10).join([f"{hop_host} node_type='hop'", *execution_hosts])
 
         # Generate inventory content based on RPM enterprise template
         inventory_content = f"""[automationgateway]
@@ -961,12 +1008,19 @@ automationedacontroller_pg_password={{{{ automationedacontroller_pg_password }}}
         return self._write_output(output_path, output_type, inventory_content)
 
     def _write_output(self, output_path: str, output_type: str, inventory_content: str) -> bool:
-        """Write inventory content to file or print to stdout."""
+        """Write inventory content to file, print to stdout or write to a stream.
+
+        For the 'stream' output type, output_path is a writable text stream rather than a path.
+        """
         try:
             if output_type == 'stdout':
                 # Print inventory content to stdout
                 print(inventory_content)
                 return True
+            elif output_type == 'stream':
+                # Write inventory content to the caller's stream (e.g. io.StringIO)
+                output_path.write(inventory_content)
+                return True
             else:
                 # Default file output
                 output_file = Path(output_path)
@@ -1075,8 +1129,11 @@ def compare_command(args):
         return 1
 
 
-def generate_command(args, log=sys.stdout):
-    """Handle the generate subcommand."""
+def generate_command(args, log=sys.stdout, out=None):
+    """Handle the generate subcommand.
+
+    If out is given, the inventory is written to that text stream instead of a file.
+    """
 
     # Validate required parameters using centralized function
     required_params = get_required_params_list(args.platform, args.topology)
@@ -1109,7 +1166,11 @@ def generate_command(args, log=sys.stdout):
 
     # Create generator and generate inventory
     generator = InventoryGenerator(args.platform, args.topology)
-    output_path = getattr(args, 'output_path', 'inventory')  # Handle hyphenated arg
+    if out is not None:
+        output_path, output_type = out, 'stream'
+    else:
+        output_path = getattr(args, 'output_path', 'inventory')  # Handle hyphenated arg
+        output_type = getattr(args, 'output_type', 'file')
 
     # Prepare kwargs for different platform/topology combinations
     kwargs = {}
@@ -1178,7 +1239,6 @@ def generate_command(args, log=sys.stdout):
             **hub_signing_params
         }
 
-    output_type = getattr(args, 'output_type', 'file')
     success = generator.generate_inventory(output_path, output_type, args.host, **kwargs)
 
     # Get results
@@ -1198,7 +1258,7 @@ def generate_command(args, log=sys.stdout):
         print(file=log)
 
     if success:
-        if output_type != 'stdout':
+        if output_type not in ('stdout', 'stream'):
             print(f"Inventory file generated successfully: {output_path}", file=log)
         return 0
     else:
@@ -9,9 +9,13 @@ and comparison functionality.
 import unittest
 import tempfile
 import os
+import re
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 from io import StringIO
 
 # Add the tools directory to the path to import the module
@@ -28,6 +32,12 @@ from aap_inventory_tool import (
     main
 )
 
+# Maps the separators in hostnames and IP addresses to filename-safe characters
+HOST_FILENAME_TABLE = str.maketrans(':.', '__')
+
+# Matches a Jinja2 template expression such as '{{ gateway_admin_password }}'
+TEMPLATE_RE = re.compile(r'\{\{.+?\}\}')
+
 
 class TestInventoryProcessor(unittest.TestCase):
     """Test cases for the InventoryProcessor base class."""
@@ -40,7 +50,6 @@ class TestInventoryProcessor(unittest.TestCase):
     def tearDown(self):
         """Clean up test fixtures."""
         # Clean up temp directory
-        import shutil
         shutil.rmtree(self.temp_dir)
 
     def create_test_inventory_file(self, content):
@@ -110,6 +119,7 @@ exec2.example.org receptor_type=hop
         results = self.processor.get_results()
         self.assertEqual(results['errors'], [])
         self.assertEqual(results['warnings'], [])
+        self.assertEqual(results['warning_codes'], set())
 
     def test_get_results_with_errors_warnings(self):
         """Test results after adding errors and warnings."""
@@ -120,6 +130,19 @@ exec2.example.org receptor_type=hop
         self.assertEqual(results['errors'], ["Test error"])
         self.assertEqual(results['warnings'], ["Test warning"])
 
+    def test_reset_clears_results(self):
+        """Test that reset clears results without touching those returned earlier."""
+        self.processor.errors.append("Test error")
+        self.processor.warnings.append("Test warning")
+        self.processor.warning_codes.add("TEST_CODE")
+        earlier = self.processor.get_results()
+
+        self.processor.reset()
+
+        results = self.processor.get_results()
+        self.assertEqual(results, {'errors': [], 'warnings': [], 'warning_codes': set()})
+        self.assertEqual(earlier['errors'], ["Test error"])
+
 
 class TestInventoryValidator(unittest.TestCase):
     """Test cases for the InventoryValidator class."""
@@ -130,7 +153,6 @@ class TestInventoryValidator(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
         shutil.rmtree(self.temp_dir)
 
     def create_test_inventory_file(self, content):
@@ -183,7 +205,7 @@ redis_mode=standalone
         result = validator.validate_inventory(file_path)
 
         self.assertTrue(result)
-        self.assertEqual(len(validator.errors), 0)
+        self.assertFalse(validator.errors)
 
     def test_validate_containerized_growth_missing_section(self):
         """Test validation with missing required section."""
@@ -283,7 +305,7 @@ redis_mode=standalone
         result = validator.validate_inventory(file_path)
 
         self.assertTrue(result)
-        self.assertEqual(len(validator.errors), 0)
+        self.assertFalse(validator.errors)
 
     def test_validate_enterprise_topology_errors(self):
         """Test that enterprise topology generates errors for single hosts."""
@@ -383,7 +405,7 @@ eda_pg_password=testpass
         result = validator.validate_inventory(file_path)
 
         self.assertTrue(result)
-        self.assertEqual(len(validator.errors), 0)
+        self.assertFalse(validator.errors)
 
     def test_validate_rpm_enterprise_valid(self):
         """Test that RPM enterprise topology passes with multiple hosts."""
@@ -434,7 +456,7 @@ automationedacontroller_pg_password=testpass
         result = validator.validate_inventory(file_path)
 
         self.assertTrue(result)
-        self.assertEqual(len(validator.errors), 0)
+        self.assertFalse(validator.errors)
 
     def test_validate_growth_topology_warnings(self):
         """Test that growth topology generates warnings for multiple hosts."""
@@ -605,7 +627,6 @@ class TestInventoryComparator(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
         shutil.rmtree(self.temp_dir)
 
     def create_test_inventory_files(self, content1, content2):
@@ -638,7 +659,7 @@ registry_password=testpass
         result = self.comparator.compare_inventories(file_path1, file_path2)
 
         self.assertTrue(result)
-        self.assertEqual(len(self.comparator.errors), 0)
+        self.assertFalse(self.comparator.errors)
 
     def test_compare_different_sections(self):
         """Test comparison of inventories with different sections."""
@@ -780,7 +801,7 @@ registry_username=testuser
         result = self.comparator.compare_inventories(file_path1, file_path2)
 
         self.assertTrue(result)
-        self.assertEqual(len(self.comparator.errors), 0)
+        self.assertFalse(self.comparator.errors)
 
     def test_compare_file_not_found(self):
         """Test comparison with non-existent file."""
@@ -807,7 +828,6 @@ class TestCLICommands(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
         shutil.rmtree(self.temp_dir)
 
     def create_test_inventory_file(self, content):
@@ -858,10 +878,11 @@ redis_mode=standalone
         file_path = self.create_test_inventory_file(content)
 
         # Mock args
-        args = MagicMock()
-        args.inventory = file_path
-        args.platform = 'containerized'
-        args.topology = 'growth'
+        args = SimpleNamespace(
+            inventory=file_path,
+            platform='containerized',
+            topology='growth',
+        )
 
         rc = validate_command(args)
 
@@ -882,10 +903,11 @@ registry_username=testuser
         file_path = self.create_test_inventory_file(content)
 
         # Mock args
-        args = MagicMock()
-        args.inventory = file_path
-        args.platform = 'containerized'
-        args.topology = 'growth'
+        args = SimpleNamespace(
+            inventory=file_path,
+            platform='containerized',
+            topology='growth',
+        )
 
         rc = validate_command(args)
 
@@ -897,10 +919,11 @@ registry_username=testuser
     @patch('sys.stdout', new_callable=StringIO)
     def test_validate_command_file_not_found(self, mock_stdout):
         """Test validate command with non-existent file."""
-        args = MagicMock()
-        args.inventory = '/nonexistent/file.ini'
-        args.platform = 'containerized'
-        args.topology = 'growth'
+        args = SimpleNamespace(
+            inventory='/nonexistent/file.ini',
+            platform='containerized',
+            topology='growth',
+        )
 
         rc = validate_command(args)
 
@@ -927,9 +950,10 @@ registry_username=testuser
             f.write(content)
 
         # Mock args
-        args = MagicMock()
-        args.inventory1 = file_path1
-        args.inventory2 = file_path2
+        args = SimpleNamespace(
+            inventory1=file_path1,
+            inventory2=file_path2,
+        )
 
         rc = compare_command(args)
 
@@ -964,9 +988,10 @@ registry_username=testuser
             f.write(content2)
 
         # Mock args
-        args = MagicMock()
-        args.inventory1 = file_path1
-        args.inventory2 = file_path2
+        args = SimpleNamespace(
+            inventory1=file_path1,
+            inventory2=file_path2,
+        )
 
         rc = compare_command(args)
 
@@ -1021,23 +1046,33 @@ class TestMainFunction(unittest.TestCase):
 class TestPasswordVariableValidation(unittest.TestCase):
     """Test cases for password variable validation."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.validator = InventoryValidator('containerized', 'growth')
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a temporary directory and a validator shared by all tests in the class."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._tmp.name
+        cls.validator = InventoryValidator('containerized', 'growth')
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temporary directory."""
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        """Clear results left on the shared validator by the previous test."""
+        self.validator.reset()
 
     def create_test_inventory(self, content: str) -> str:
-        """Create a temporary inventory file with given content."""
-        temp_file = os.path.join(self.temp_dir, 'test_inventory.ini')
-        with open(temp_file, 'w') as f:
+        """Create a uniquely named inventory file with given content."""
+        fd, temp_file = tempfile.mkstemp(suffix='.ini', dir=self.temp_dir)
+        with os.fdopen(fd, 'w') as f:
             f.write(content)
         return temp_file
 
+    def _assert_error_contains(self, needle: str):
+        """Assert that at least one validation error contains the given text."""
+        self.assertIn(needle, '\n'.join(self.validator.get_results()['errors']))
+
     def test_missing_password_variables(self):
         """Test validation fails when password variables are missing."""
         inventory_content = """
@@ -1077,10 +1112,9 @@ eda_pg_password=edadb123
         inventory_file = self.create_test_inventory(inventory_content)
 
         is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
 
         self.assertFalse(is_valid)
-        self.assertTrue(any('postgresql_admin_password' in error for error in results['errors']))
+        self._assert_error_contains('postgresql_admin_password')
 
     def test_empty_password_variables(self):
         """Test validation fails when password variables are empty."""
@@ -1121,11 +1155,9 @@ eda_pg_password=edadb123
         inventory_file = self.create_test_inventory(inventory_content)
 
         is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
 
         self.assertFalse(is_valid)
-        self.assertTrue(
-            any("Password variable 'postgresql_admin_password' is empty" in error for error in results['errors']))
+        self._assert_error_contains("Password variable 'postgresql_admin_password' is empty")
 
     def test_parameterized_password_variables_warning(self):
         """Test validation warns about parameterized password variables."""
@@ -1170,33 +1202,33 @@ redis_mode=standalone
         results = self.validator.get_results()
 
         self.assertTrue(is_valid)
+        self.assertIn('TEMPLATED_PASSWORD', results['warning_codes'])
         self.assertTrue(any(
             "postgresql_admin_password" in warning and "parameterized" in warning for warning in results['warnings']))
         # registry_password is not required, so it won't generate warnings about parameterization
 
     def test_placeholder_detection(self):
         """Test detection of Jinja2 placeholder patterns."""
-        test_cases = [
-            ("{{ vault_password }}", True),
-            ("{{vault_password}}", True),
-            ("prefix_{{ vault_password }}_suffix", True),
-            ("${PASSWORD}", False),
-            ("CHANGEME", False),
-            ("REPLACE_THIS", False),
-            ("TODO: set password", False),
-            ("FIXME", False),
-            ("<password>", False),
-            ("example_password", False),
-            ("dummy_pass", False),
-            ("real_password_123", False),
-            ("secretpassword", False),
-            ("", False),
-        ]
-
-        for value, expected in test_cases:
-            with self.subTest(value=value):
-                result = self.validator._is_variable_placeholder(value)
-                self.assertEqual(result, expected, f"Failed for value: '{value}'")
+        expected = {
+            "{{ vault_password }}": True,
+            "{{vault_password}}": True,
+            "prefix_{{ vault_password }}_suffix": True,
+            "${PASSWORD}": False,
+            "CHANGEME": False,
+            "REPLACE_THIS": False,
+            "TODO: set password": False,
+            "FIXME": False,
+            "<password>": False,
+            "example_password": False,
+            "dummy_pass": False,
+            "real_password_123": False,
+            "secretpassword": False,
+            "": False,
+        }
+
+        # Compare all cases at once; a failure diff lists every mismatching value
+        actual = {value: self.validator._is_variable_placeholder(value) for value in expected}
+        self.assertEqual(actual, expected)
 
     def test_valid_inventory_with_all_passwords(self):
         """Test validation passes when all password variables are present."""
@@ -1241,7 +1273,7 @@ redis_mode=standalone
         results = self.validator.get_results()
 
         self.assertTrue(is_valid)
-        self.assertEqual(len(results['errors']), 0)
+        self.assertFalse(results['errors'])
 
     def test_rpm_platform_password_validation(self):
         """Test password validation for RPM platform."""
@@ -1289,7 +1321,7 @@ redis_mode=standalone
         results = rpm_validator.get_results()
 
         self.assertTrue(is_valid)
-        self.assertEqual(len(results['errors']), 0)
+        self.assertFalse(results['errors'])
 
     def test_multiple_missing_passwords(self):
         """Test validation reports multiple missing password variables."""
@@ -1334,9 +1366,9 @@ eda_pg_host=server.example.com
         self.assertGreater(len(password_errors), 1)
 
         # Check for specific missing passwords - only required ones
-        self.assertTrue(any('postgresql_admin_password' in error for error in results['errors']))
-        self.assertTrue(any('gateway_pg_password' in error for error in results['errors']))
-        self.assertTrue(any('controller_pg_password' in error for error in results['errors']))
+        self._assert_error_contains('postgresql_admin_password')
+        self._assert_error_contains('gateway_pg_password')
+        self._assert_error_contains('controller_pg_password')
 
     def test_whitespace_only_password_variables(self):
         """Test validation fails when password variables contain only whitespace."""
@@ -1377,11 +1409,9 @@ eda_pg_password=edadb123
         inventory_file = self.create_test_inventory(inventory_content)
 
         is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
 
         self.assertFalse(is_valid)
-        self.assertTrue(
-            any("Password variable 'postgresql_admin_password' is empty" in error for error in results['errors']))
+        self._assert_error_contains("Password variable 'postgresql_admin_password' is empty")
 
     def test_mixed_valid_and_parameterized_passwords(self):
         """Test validation with mix of valid and parameterized password variables."""
@@ -1440,20 +1470,26 @@ redis_mode=standalone
 class TestHostValidation(unittest.TestCase):
     """Test cases for host validation methods."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.validator = InventoryValidator('containerized', 'growth')
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a temporary directory and a validator shared by all tests in the class."""
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._tmp.name
+        cls.validator = InventoryValidator('containerized', 'growth')
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temporary directory."""
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        """Clear results left on the shared validator by the previous test."""
+        self.validator.reset()
 
     def create_test_inventory(self, content: str) -> str:
-        """Create a temporary inventory file with given content."""
-        temp_file = os.path.join(self.temp_dir, 'test_inventory.ini')
-        with open(temp_file, 'w') as f:
+        """Create a uniquely named inventory file with given content."""
+        fd, temp_file = tempfile.mkstemp(suffix='.ini', dir=self.temp_dir)
+        with os.fdopen(fd, 'w') as f:
             f.write(content)
         return temp_file
 
@@ -1469,7 +1505,8 @@ class TestHostValidation(unittest.TestCase):
             'server.example.com.',  # trailing dot
             'host',  # single label
             'a' * 63,  # max label length
-            'a.b'  # minimal two-label domain
+            'a.b',  # minimal two-label domain
+            'HOST.EXAMPLE.COM',  # uppercase is allowed
         ]
 
         invalid_hostnames = [
@@ -1484,22 +1521,12 @@ class TestHostValidation(unittest.TestCase):
             'a' * 254,  # hostname too long
             '.host.example.com',  # starting with dot
             'host.example.com..',  # ending with double dots
-            'HOST.EXAMPLE.COM',  # uppercase (actually valid, but test case)
         ]
 
-        for hostname in valid_hostnames:
-            with self.subTest(hostname=hostname):
-                self.assertTrue(self.validator._is_valid_hostname(hostname),
-                                f"'{hostname}' should be valid")
-
-        for hostname in invalid_hostnames:
-            with self.subTest(hostname=hostname):
-                if hostname == 'HOST.EXAMPLE.COM':
-                    # Actually valid - uppercase is allowed
-                    self.assertTrue(self.validator._is_valid_hostname(hostname))
-                else:
-                    self.assertFalse(self.validator._is_valid_hostname(hostname),
-                                     f"'{hostname}' should be invalid")
+        expected = {hostname: True for hostname in valid_hostnames}
+        expected.update((hostname, False) for hostname in invalid_hostnames)
+        actual = {hostname: self.validator._is_valid_hostname(hostname) for hostname in expected}
+        self.assertEqual(actual, expected)
 
     def test_is_valid_ip(self):
         """Test IP address validation."""
@@ -1537,20 +1564,10 @@ class TestHostValidation(unittest.TestCase):
             '999.999.999.999',  # out of range
         ]
 
-        for ip in valid_ipv4:
-            with self.subTest(ip=ip):
-                self.assertTrue(self.validator._is_valid_ip(ip),
-                                f"'{ip}' should be valid IPv4")
-
-        for ip in valid_ipv6:
-            with self.subTest(ip=ip):
-                self.assertTrue(self.validator._is_valid_ip(ip),
-                                f"'{ip}' should be valid IPv6")
-
-        for ip in invalid_ips:
-            with self.subTest(ip=ip):
-                self.assertFalse(self.validator._is_valid_ip(ip),
-                                 f"'{ip}' should be invalid")
+        expected = {ip: True for ip in valid_ipv4 + valid_ipv6}
+        expected.update((ip, False) for ip in invalid_ips)
+        actual = {ip: self.validator._is_valid_ip(ip) for ip in expected}
+        self.assertEqual(actual, expected)
 
     def test_is_hostname_or_ip(self):
         """Test combined hostname/IP validation."""
@@ -1572,42 +1589,40 @@ class TestHostValidation(unittest.TestCase):
             'alias_name'  # underscore (could be alias)
         ]
 
-        for entry in valid_entries:
-            with self.subTest(entry=entry):
-                self.assertTrue(self.validator._is_hostname_or_ip(entry),
-                                f"'{entry}' should be valid hostname or IP")
-
-        for entry in invalid_entries:
-            with self.subTest(entry=entry):
-                self.assertFalse(self.validator._is_hostname_or_ip(entry),
-                                 f"'{entry}' should be invalid")
+        expected = {entry: True for entry in valid_entries}
+        expected.update((entry, False) for entry in invalid_entries)
+        actual = {entry: self.validator._is_hostname_or_ip(entry) for entry in expected}
+        self.assertEqual(actual, expected)
 
     def test_parse_host_entry(self):
         """Test parsing of host entries."""
+        expected = {
+            'server.example.com': ('server.example.com', {}),
+            'server.example.com ansible_host=192.168.1.1':
+                ('server.example.com', {'ansible_host': '192.168.1.1'}),
+            'web-server ansible_host=web.example.com ansible_port=8080':
+                ('web-server', {'ansible_host': 'web.example.com', 'ansible_port': '8080'}),
+            '192.168.1.1': ('192.168.1.1', {}),
+            'node1 ansible_host=10.0.0.1 ansible_user=admin':
+                ('node1', {'ansible_host': '10.0.0.1', 'ansible_user': 'admin'}),
+            'host receptor_type=hop': ('host', {'receptor_type': 'hop'}),
+            'server key=value another=test':
+                ('server', {'key': 'value', 'another': 'test'}),
+            'server key=value=with=equals':
+                ('server', {'key': 'value=with=equals'}),
+        }
+
+        actual = {host_entry: self.validator._parse_host_entry(host_entry) for host_entry in expected}
+        self.assertEqual(actual, expected)
+
+    def test_validate_host_entries(self):
+        """Test host validation of hostnames, IPs and aliases with and without ansible_host."""
+        missing = 'must have ansible_host defined'
+        invalid = 'has invalid ansible_host'
+
+        # (description, group sections, expected (alias, error fragment) pairs)
         test_cases = [
-            ('server.example.com', ('server.example.com', {})),
-            ('server.example.com ansible_host=192.168.1.1',
-             ('server.example.com', {'ansible_host': '192.168.1.1'})),
-            ('web-server ansible_host=web.example.com ansible_port=8080',
-             ('web-server', {'ansible_host': 'web.example.com', 'ansible_port': '8080'})),
-            ('192.168.1.1', ('192.168.1.1', {})),
-            ('node1 ansible_host=10.0.0.1 ansible_user=admin',
-             ('node1', {'ansible_host': '10.0.0.1', 'ansible_user': 'admin'})),
-            ('host receptor_type=hop', ('host', {'receptor_type': 'hop'})),
-            ('server key=value another=test',
-             ('server', {'key': 'value', 'another': 'test'})),
-            ('server key=value=with=equals',
-             ('server', {'key': 'value=with=equals'})),
-        ]
-
-        for host_entry, expected in test_cases:
-            with self.subTest(host_entry=host_entry):
-                result = self.validator._parse_host_entry(host_entry)
-                self.assertEqual(result, expected)
-
-    def test_validate_host_entries_valid_hostnames(self):
-        """Test host validation with valid hostnames."""
-        inventory_content = """
+            ('valid hostnames', """
 [automationgateway]
 gateway.example.com
 gateway-2.example.org
@@ -1619,23 +1634,8 @@ controller.example.com
 [automationhub]
 hub.example.com
 2001:db8::1
-
-[all:vars]
-registry_username=admin
-"""
-        inventory_file = self.create_test_inventory(inventory_content)
-
-        is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
-
-        # Should not have host validation errors
-        host_errors = [error for error in results['errors'] if
-                       ('has invalid ansible_host' in error or 'must have ansible_host defined' in error)]
-        self.assertEqual(len(host_errors), 0)
-
-    def test_validate_host_entries_valid_aliases(self):
-        """Test host validation with valid aliases."""
-        inventory_content = """
+""", []),
+            ('valid aliases', """
 [automationgateway]
 gateway-primary ansible_host=gateway.example.com
 gateway-backup ansible_host=192.168.1.1
@@ -1646,77 +1646,26 @@ controller-2 ansible_host=10.0.0.1
 
 [automationhub]
 hub-node ansible_host=2001:db8::1
-
-[all:vars]
-registry_username=admin
-"""
-        inventory_file = self.create_test_inventory(inventory_content)
-
-        is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
-
-        # Should not have host validation errors
-        host_errors = [error for error in results['errors'] if
-                       ('has invalid ansible_host' in error or 'must have ansible_host defined' in error)]
-        self.assertEqual(len(host_errors), 0)
-
-    def test_validate_host_entries_invalid_aliases_missing_ansible_host(self):
-        """Test host validation with aliases missing ansible_host."""
-        inventory_content = """
+""", []),
+            ('invalid aliases missing ansible_host', """
 [automationgateway]
 gateway_primary
 web-server_backup
 
 [automationcontroller]
 controller_node_1
-
-[all:vars]
-registry_username=admin
-"""
-        inventory_file = self.create_test_inventory(inventory_content)
-
-        is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
-
-        # Should have host validation errors for missing ansible_host
-        host_errors = [error for error in results['errors'] if 'must have ansible_host defined' in error]
-        self.assertEqual(len(host_errors), 3)  # 3 invalid aliases
-
-        # Check specific error messages
-        self.assertTrue(any('gateway_primary' in error for error in host_errors))
-        self.assertTrue(any('web-server_backup' in error for error in host_errors))
-        self.assertTrue(any('controller_node_1' in error for error in host_errors))
-
-    def test_validate_host_entries_invalid_ansible_host_values(self):
-        """Test host validation with invalid ansible_host values."""
-        inventory_content = """
+""", [('gateway_primary', missing), ('web-server_backup', missing), ('controller_node_1', missing)]),
+            # 192.168.1.256 is not an IP address but is a valid hostname
+            ('invalid ansible_host values', """
 [automationgateway]
 gateway_primary ansible_host=invalid..hostname
 gateway-backup ansible_host=192.168.1.256
 
 [automationcontroller]
 controller_1 ansible_host=host@invalid.com
-
-[all:vars]
-registry_username=admin
-"""
-        inventory_file = self.create_test_inventory(inventory_content)
-
-        is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
-
-        # Should have host validation errors for invalid ansible_host values
-        host_errors = [error for error in results['errors'] if 'has invalid ansible_host' in error]
-        self.assertEqual(len(host_errors),
-                         2)  # 2 invalid ansible_host values (192.168.1.256 is actually valid as hostname)
-
-        # Check specific error messages
-        self.assertTrue(any('gateway_primary' in error and 'invalid..hostname' in error for error in host_errors))
-        self.assertTrue(any('controller_1' in error and 'host@invalid.com' in error for error in host_errors))
-
-    def test_validate_host_entries_mixed_valid_invalid(self):
-        """Test host validation with mix of valid and invalid entries."""
-        inventory_content = """
+""", [('gateway_primary', invalid), ('gateway_primary', 'invalid..hostname'),
+      ('controller_1', invalid), ('controller_1', 'host@invalid.com')]),
+            ('mixed valid and invalid', """
 [automationgateway]
 gateway.example.com
 gateway-alias ansible_host=gateway-backup.example.com
@@ -1728,28 +1677,8 @@ controller_invalid_alias
 [automationhub]
 hub_node ansible_host=host@invalid.com
 hub.example.com
-
-[all:vars]
-registry_username=admin
-"""
-        inventory_file = self.create_test_inventory(inventory_content)
-
-        is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
-
-        # Should have host validation errors for the invalid entries only
-        host_errors = [error for error in results['errors'] if
-                       ('has invalid ansible_host' in error or 'must have ansible_host defined' in error)]
-        self.assertEqual(len(host_errors), 2)  # 2 invalid entries
-
-        # Check specific error messages
-        self.assertTrue(any(
-            'controller_invalid_alias' in error and 'must have ansible_host defined' in error for error in host_errors))
-        self.assertTrue(any('hub_node' in error and 'host@invalid.com' in error for error in host_errors))
-
-    def test_validate_host_entries_with_additional_variables(self):
-        """Test host validation with additional host variables."""
-        inventory_content = """
+""", [('controller_invalid_alias', missing), ('hub_node', 'host@invalid.com')]),
+            ('additional host variables', """
 [automationgateway]
 gateway.example.com ansible_port=8080 ansible_user=admin
 
@@ -1758,23 +1687,9 @@ controller-alias ansible_host=controller.example.com ansible_port=443 receptor_t
 
 [execution_nodes]
 exec-node ansible_host=192.168.1.100 receptor_type=execution
-
-[all:vars]
-registry_username=admin
-"""
-        inventory_file = self.create_test_inventory(inventory_content)
-
-        is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
-
-        # Should not have host validation errors (ignore topology errors)
-        host_errors = [error for error in results['errors'] if
-                       ('has invalid ansible_host' in error or 'must have ansible_host defined' in error)]
-        self.assertEqual(len(host_errors), 0)
-
-    def test_validate_host_entries_empty_sections(self):
-        """Test host validation with empty sections."""
-        inventory_content = """
+""", []),
+            # Empty sections are reported by section validation, not host validation
+            ('empty sections', """
 [automationgateway]
 gateway.example.com
 
@@ -1782,23 +1697,9 @@ gateway.example.com
 
 [automationhub]
 hub.example.com
-
-[all:vars]
-registry_username=admin
-"""
-        inventory_file = self.create_test_inventory(inventory_content)
-
-        is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
-
-        # Should not have host validation errors (empty sections are handled elsewhere)
-        host_errors = [error for error in results['errors'] if
-                       ('has invalid ansible_host' in error or 'must have ansible_host defined' in error)]
-        self.assertEqual(len(host_errors), 0)
-
-    def test_validate_special_characters_in_hostnames(self):
-        """Test validation of hostnames with special characters."""
-        inventory_content = """
+""", []),
+            # Aliases with special characters are fine as long as ansible_host is valid
+            ('special characters in aliases', """
 [automationgateway]
 server-with-dashes.example.com
 server123.example.org
@@ -1806,31 +1707,57 @@ server123.example.org
 [automationcontroller]
 under_score_host ansible_host=valid-server.example.com
 special@host ansible_host=192.168.1.1
+""", []),
+        ]
 
-[all:vars]
-registry_username=admin
-"""
-        inventory_file = self.create_test_inventory(inventory_content)
+        for description, content, expected_errors in test_cases:
+            with self.subTest(description):
+                validator = self.validator
+                validator.reset()
+                sections, _ = validator.parse_inventory(self.create_test_inventory(content))
 
-        is_valid = self.validator.validate_inventory(inventory_file)
-        results = self.validator.get_results()
+                # Only run host entry validation so no other errors are mixed in
+                validator._validate_host_entries(sections)
+                errors = validator.get_results()['errors']
 
-        # Should not have errors because the ansible_host values are valid
-        host_errors = [error for error in results['errors'] if
-                       ('has invalid ansible_host' in error or 'must have ansible_host defined' in error)]
-        self.assertEqual(len(host_errors), 0)  # All have valid ansible_host values
+                self.assertEqual(len(errors), len({alias for alias, _ in expected_errors}), errors)
+                for alias, fragment in expected_errors:
+                    self.assertTrue(any(f"'{alias}'" in error and fragment in error for error in errors),
+                                    f"No error for '{alias}' containing '{fragment}': {errors}")
 
 
 class TestInventoryGenerator(unittest.TestCase):
     """Test cases for the InventoryGenerator class."""
 
+    # Groups every containerized growth inventory defines
+    EXPECTED_SECTIONS = ('automationgateway', 'automationcontroller', 'automationhub', 'automationeda', 'database')
+
+    # Variables every containerized growth inventory defines
+    EXPECTED_VARS = frozenset({
+        'ansible_connection', 'postgresql_admin_password',
+        'registry_username', 'registry_password', 'redis_mode',
+        'gateway_admin_password', 'gateway_pg_host', 'gateway_pg_password',
+        'controller_admin_password', 'controller_pg_host', 'controller_pg_password',
+        'controller_percent_memory_capacity',
+        'hub_admin_password', 'hub_pg_host', 'hub_pg_password', 'hub_seed_collections',
+        'eda_admin_password', 'eda_pg_host', 'eda_pg_password'
+    })
+
+    # Credential variables that the generator leaves as Jinja2 templates
+    PASSWORD_VARS = frozenset({
+        'postgresql_admin_password', 'registry_username', 'registry_password',
+        'gateway_admin_password', 'gateway_pg_password',
+        'controller_admin_password', 'controller_pg_password',
+        'hub_admin_password', 'hub_pg_password',
+        'eda_admin_password', 'eda_pg_password'
+    })
+
     def setUp(self):
         """Set up test fixtures."""
         self.temp_dir = tempfile.mkdtemp()
 
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
         shutil.rmtree(self.temp_dir)
 
     def test_generate_containerized_growth_basic(self):
@@ -1844,7 +1771,7 @@ class TestInventoryGenerator(unittest.TestCase):
         results = generator.get_results()
 
         self.assertTrue(success)
-        self.assertEqual(len(results['errors']), 0)
+        self.assertFalse(results['errors'])
 
         # Verify file was created
         self.assertTrue(Path(output_path).exists())
@@ -1889,6 +1816,16 @@ class TestInventoryGenerator(unittest.TestCase):
         # File should not exist
         self.assertFalse(Path(output_path).exists())
 
+    def test_build_inventory_string_without_host(self):
+        """Test that building inventory content fails without host for containerized growth."""
+        generator = InventoryGenerator('containerized', 'growth')
+
+        content = generator.build_inventory_string()
+        results = generator.get_results()
+
+        self.assertIsNone(content)
+        self.assertTrue(any('Host is required' in error for error in results['errors']))
+
     def test_generate_unsupported_platform_topology(self):
         """Test generation fails for unsupported platform/topology combinations."""
         # Test invalid platform
@@ -1924,9 +1861,9 @@ class TestInventoryGenerator(unittest.TestCase):
         results = generator.get_results()
 
         self.assertTrue(success)
-        self.assertEqual(len(results['errors']), 0)
+        self.assertFalse(results['errors'])
+        # The file existing implies its parent directories were created
         self.assertTrue(Path(output_path).exists())
-        self.assertTrue(Path(output_path).parent.exists())
 
     def test_generate_file_write_error(self):
         """Test handling of file write errors."""
@@ -1961,86 +1898,72 @@ class TestInventoryGenerator(unittest.TestCase):
         self.assertTrue(is_valid)
 
         # Should have warnings about parameterized passwords, but no errors
-        self.assertEqual(len(results['errors']), 0)
-        self.assertTrue(any('parameterized' in warning for warning in results['warnings']))
+        self.assertFalse(results['errors'])
+        self.assertIn('TEMPLATED_PASSWORD', results['warning_codes'])
 
     def test_generated_inventory_content_structure(self):
         """Test the detailed structure of generated inventory content."""
         generator = InventoryGenerator('containerized', 'growth')
-        output_path = os.path.join(self.temp_dir, 'generated_inventory')
-        output_type = 'file'
         host = 'myhost.example.org'
 
-        success = generator.generate_inventory(output_path, output_type, host)
-        self.assertTrue(success)
+        content = generator.build_inventory_string(host)
+        self.assertIsNotNone(content)
 
-        # Parse the generated file to verify structure
-        sections, variables = generator.parse_inventory(output_path)
+        # Parse the generated content to verify structure
+        sections, variables = generator.parse_inventory_string(content)
 
         # Check sections contain the host
-        expected_sections = ['automationgateway', 'automationcontroller', 'automationhub', 'automationeda', 'database']
-        for section in expected_sections:
-            self.assertIn(section, sections)
-            self.assertEqual(sections[section], [host])
+        expected_sections = {section: [host] for section in self.EXPECTED_SECTIONS}
+        self.assertEqual({section: sections.get(section) for section in self.EXPECTED_SECTIONS}, expected_sections)
 
         # Check variables
-        expected_vars = [
-            'ansible_connection', 'postgresql_admin_password',
-            'registry_username', 'registry_password', 'redis_mode',
-            'gateway_admin_password', 'gateway_pg_host', 'gateway_pg_password',
-            'controller_admin_password', 'controller_pg_host', 'controller_pg_password',
-            'controller_percent_memory_capacity',
-            'hub_admin_password', 'hub_pg_host', 'hub_pg_password', 'hub_seed_collections',
-            'eda_admin_password', 'eda_pg_host', 'eda_pg_password'
-        ]
-
-        for var in expected_vars:
-            self.assertIn(var, variables)
-
-        # Check specific values
-        self.assertEqual(variables['ansible_connection'], 'local')
-        self.assertEqual(variables['redis_mode'], 'standalone')
-        self.assertEqual(variables['controller_percent_memory_capacity'], '0.5')
-        self.assertEqual(variables['hub_seed_collections'], 'false')
-
-        # Check that host variables point to the host
-        self.assertEqual(variables['gateway_pg_host'], host)
-        self.assertEqual(variables['controller_pg_host'], host)
-        self.assertEqual(variables['hub_pg_host'], host)
-        self.assertEqual(variables['eda_pg_host'], host)
+        missing = self.EXPECTED_VARS - variables.keys()
+        self.assertFalse(missing, f"Generated inventory missing variables: {missing}")
+
+        # Check specific values, and that host variables point to the host
+        expected_values = {
+            'ansible_connection': 'local',
+            'redis_mode': 'standalone',
+            'controller_percent_memory_capacity': '0.5',
+            'hub_seed_collections': 'false',
+            'gateway_pg_host': host,
+            'controller_pg_host': host,
+            'hub_pg_host': host,
+            'eda_pg_host': host,
+        }
+        self.assertEqual({var: variables[var] for var in expected_values}, expected_values)
 
         # Check that password variables are templated
-        password_vars = ['postgresql_admin_password', 'registry_username', 'registry_password',
-                         'gateway_admin_password', 'gateway_pg_password',
-                         'controller_admin_password', 'controller_pg_password',
-                         'hub_admin_password', 'hub_pg_password',
-                         'eda_admin_password', 'eda_pg_password']
-
-        for var in password_vars:
-            self.assertIn('{{', variables[var])
-            self.assertIn('}}', variables[var])
+        for var in self.PASSWORD_VARS:
+            self.assertRegex(variables[var], TEMPLATE_RE)
 
 
 class TestGenerateCommand(unittest.TestCase):
     """Test cases for the generate_command function."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a temporary directory shared by all tests in the class."""
+        cls._tmp = tempfile.TemporaryDirectory()
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temporary directory."""
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        """Give each test its own subdirectory of the shared one."""
+        self.temp_dir = tempfile.mkdtemp(dir=self._tmp.name)
 
     @patch('sys.stdout', new_callable=StringIO)
     def test_generate_command_success(self, mock_stdout):
         """Test successful generate command."""
-        args = MagicMock()
-        args.platform = 'containerized'
-        args.topology = 'growth'
-        args.host = 'test.example.com'
-        args.output_path = os.path.join(self.temp_dir, 'test_inventory')
+        args = SimpleNamespace(
+            platform='containerized',
+            topology='growth',
+            host='test.example.com',
+            output_path=os.path.join(self.temp_dir, 'test_inventory'),
+        )
 
         rc = generate_command(args)
 
@@ -2052,11 +1975,12 @@ class TestGenerateCommand(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_generate_command_missing_host(self, mock_stdout):
         """Test generate command failure when host is missing for containerized growth."""
-        args = MagicMock()
-        args.platform = 'containerized'
-        args.topology = 'growth'
-        args.host = None
-        args.output_path = os.path.join(self.temp_dir, 'test_inventory')
+        args = SimpleNamespace(
+            platform='containerized',
+            topology='growth',
+            host=None,
+            output_path=os.path.join(self.temp_dir, 'test_inventory'),
+        )
 
         rc = generate_command(args)
 
@@ -2067,18 +1991,19 @@ class TestGenerateCommand(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_generate_command_unsupported_platform_topology(self, mock_stdout):
         """Test generate command with unsupported platform/topology."""
-        args = MagicMock()
-        args.platform = 'rpm'
-        args.topology = 'growth'
-        # Missing required arguments for RPM growth
-        args.gateway_host = None
-        args.controller_host = None
-        args.execution_host = None
-        args.hub_host = None
-        args.eda_host = None
-        args.database_host = None
-        args.host = 'test.example.com'
-        args.output_path = os.path.join(self.temp_dir, 'test_inventory')
+        args = SimpleNamespace(
+            platform='rpm',
+            topology='growth',
+            # Missing required arguments for RPM growth
+            gateway_host=None,
+            controller_host=None,
+            execution_host=None,
+            hub_host=None,
+            eda_host=None,
+            database_host=None,
+            host='test.example.com',
+            output_path=os.path.join(self.temp_dir, 'test_inventory'),
+        )
 
         rc = generate_command(args)
 
@@ -2086,41 +2011,61 @@ class TestGenerateCommand(unittest.TestCase):
         output = mock_stdout.getvalue()
         self.assertIn('Error:', output)
 
+    def test_generate_command_stream_output(self):
+        """Test generate command writing the inventory to a stream instead of a file."""
+        args = SimpleNamespace(
+            platform='containerized',
+            topology='growth',
+            host='test.example.com',
+            output_path=os.path.join(self.temp_dir, 'test_inventory'),
+        )
+        inventory = StringIO()
+        log = StringIO()
+
+        rc = generate_command(args, log, out=inventory)
+
+        self.assertEqual(0, rc)
+        self.assertIn('[automationgateway]\ntest.example.com', inventory.getvalue())
+        self.assertNotIn('Inventory file generated successfully', log.getvalue())
+        self.assertFalse(Path(args.output_path).exists())
+
     @patch('sys.stdout', new_callable=StringIO)
     def test_generate_command_default_output_path(self, mock_stdout):
         """Test generate command with default output path."""
-        args = MagicMock()
-        args.platform = 'containerized'
-        args.topology = 'growth'
-        args.host = 'test.example.com'
-        # Simulate missing output_path attribute (hyphenated arg)
-        del args.output_path
-
-        # Change to temp directory so default 'inventory' file is created there
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(self.temp_dir)
-            rc = generate_command(args)
-
-            self.assertEqual(0, rc)
-            output = mock_stdout.getvalue()
-            self.assertIn('Inventory file generated successfully: inventory', output)
-            self.assertTrue(Path('inventory').exists())
-        finally:
-            os.chdir(original_cwd)
+        args = SimpleNamespace(
+            platform='containerized',
+            topology='growth',
+            host='test.example.com',
+            # No output_path attribute, so the default is used
+        )
+
+        # Intercept the write rather than changing the working directory, which is process-wide
+        with patch.object(InventoryGenerator, '_write_output', return_value=True) as write_output:
+            rc = generate_command(args, log=mock_stdout)
+
+        self.assertEqual(0, rc)
+        output_path, output_type, _ = write_output.call_args.args
+        self.assertEqual(('inventory', 'file'), (output_path, output_type))
+        output = mock_stdout.getvalue()
+        self.assertIn('Inventory file generated successfully: inventory', output)
 
 
 class TestGenerateIntegration(unittest.TestCase):
     """Integration tests for the generate functionality with validation."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a temporary directory shared by all tests in the class."""
+        cls._tmp = tempfile.TemporaryDirectory()
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temporary directory."""
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        """Give each test its own subdirectory of the shared one."""
+        self.temp_dir = tempfile.mkdtemp(dir=self._tmp.name)
 
     def test_generate_and_validate_cycle(self):
         """Test complete cycle: generate inventory, then validate it."""
@@ -2140,96 +2085,75 @@ class TestGenerateIntegration(unittest.TestCase):
 
         # Should be valid with warnings about templated passwords
         self.assertTrue(is_valid)
-        self.assertEqual(len(results['errors']), 0)
+        self.assertFalse(results['errors'])
         # Should have warnings about parameterized passwords
-        self.assertTrue(len(results['warnings']) > 0)
-        self.assertTrue(any('parameterized' in warning for warning in results['warnings']))
+        self.assertTrue(results['warnings'])
+        self.assertIn('TEMPLATED_PASSWORD', results['warning_codes'])
 
     def test_generate_and_compare_with_reference(self):
         """Test generating inventory and comparing with a reference manually created inventory."""
         # Generate inventory
         generator = InventoryGenerator('containerized', 'growth')
-        output_type = 'file'
-        generated_path = os.path.join(self.temp_dir, 'generated_inventory')
         host = 'server.example.com'
 
-        success = generator.generate_inventory(generated_path, output_type, host)
-        self.assertTrue(success)
-
-        # Create a reference inventory manually (without templates)
-        reference_content = f"""[automationgateway]
-{host}
-
-[automationcontroller]
-{host}
-
-[automationhub]
-{host}
-
-[automationeda]
-{host}
-
-[database]
-{host}
-
-[all:vars]
-ansible_connection=local
-
-postgresql_admin_password=testpass
-
-registry_username=testuser
-registry_password=testpass
-
-redis_mode=standalone
-
-gateway_admin_password=testpass
-gateway_pg_host={host}
-gateway_pg_password=testpass
-
-controller_admin_password=testpass
-controller_pg_host={host}
-controller_pg_password=testpass
-controller_percent_memory_capacity=0.5
-
-hub_admin_password=testpass
-hub_pg_host={host}
-hub_pg_password=testpass
-hub_seed_collections=false
-
-eda_admin_password=testpass
-eda_pg_host={host}
-eda_pg_password=testpass
-"""
-
-        reference_path = os.path.join(self.temp_dir, 'reference_inventory')
-        with open(reference_path, 'w') as f:
-            f.write(reference_content)
-
-        # Parse both inventories
-        generated_sections, generated_vars = generator.parse_inventory(generated_path)
-        ref_sections, ref_vars = generator.parse_inventory(reference_path)
+        generated_content = generator.build_inventory_string(host)
+        self.assertIsNotNone(generated_content)
+
+        generated_sections, generated_vars = generator.parse_inventory_string(generated_content)
+
+        # Reference inventory, written out by hand: every group holds the single host
+        ref_sections = {
+            section: [host]
+            for section in ['automationgateway', 'automationcontroller', 'automationhub',
+                            'automationeda', 'database']
+        }
+        # Non-password variables must match exactly
+        ref_vars = {
+            'ansible_connection': 'local',
+            'redis_mode': 'standalone',
+            'controller_percent_memory_capacity': '0.5',
+            'hub_seed_collections': 'false',
+            'gateway_pg_host': host,
+            'controller_pg_host': host,
+            'hub_pg_host': host,
+            'eda_pg_host': host,
+        }
+        # Credential variables only need to be present; generated values are templated
+        ref_credential_keys = {
+            'postgresql_admin_password', 'registry_username', 'registry_password',
+            'gateway_admin_password', 'gateway_pg_password',
+            'controller_admin_password', 'controller_pg_password',
+            'hub_admin_password', 'hub_pg_password',
+            'eda_admin_password', 'eda_pg_password',
+        }
 
         # Sections should be identical
         self.assertEqual(generated_sections, ref_sections)
 
-        # Variables should have same keys, but generated will have templated values
-        # Note: generated inventory may have additional variables like hub signing
-        generated_keys = set(generated_vars.keys())
-        ref_keys = set(ref_vars.keys())
-
         # All reference keys should be in generated
-        missing_keys = ref_keys - generated_keys
-        self.assertEqual(len(missing_keys), 0, f"Generated inventory missing keys: {missing_keys}")
-
         # Generated may have additional keys (like hub signing vars), that's ok
+        missing_keys = (ref_vars.keys() | ref_credential_keys) - generated_vars.keys()
+        self.assertFalse(missing_keys, f"Generated inventory missing keys: {missing_keys}")
+
+        self.assertEqual({var: generated_vars[var] for var in ref_vars}, ref_vars)
 
-        # Non-password variables should match exactly
-        non_password_vars = ['ansible_connection', 'redis_mode',
-                             'controller_percent_memory_capacity', 'hub_seed_collections']
-        non_password_vars.extend([f'{comp}_pg_host' for comp in ['gateway', 'controller', 'hub', 'eda']])
+    def _gen_and_validate(self, host: str):
+        """Generate an inventory for host and validate it.
+
+        Returns (host, success, host appears in content, is valid).
+        """
+        generator = InventoryGenerator('containerized', 'growth')
+        output_path = os.path.join(self.temp_dir, f'inventory_{host.translate(HOST_FILENAME_TABLE)}')
 
-        for var in non_password_vars:
-            self.assertEqual(generated_vars[var], ref_vars[var])
+        success = generator.generate_inventory(output_path, 'file', host)
+        if not success:
+            return host, False, False, False
+
+        with open(output_path, 'r') as f:
+            content = f.read()
+
+        validator = InventoryValidator('containerized', 'growth')
+        return host, True, host in content, validator.validate_inventory(output_path)
 
     def test_multiple_hosts_edge_cases(self):
         """Test generation with various host formats (hostnames and IPs)."""
@@ -2241,23 +2165,14 @@ eda_pg_password=testpass
             '2001:db8::1'
         ]
 
-        for host in test_hosts:
-            with self.subTest(host=host):
-                generator = InventoryGenerator('containerized', 'growth')
-                output_path = os.path.join(self.temp_dir, f'inventory_{host.replace(":", "_").replace(".", "_")}')
-                output_type = 'file'
+        # Each host is generated and validated independently, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(test_hosts)) as executor:
+            results = list(executor.map(self._gen_and_validate, test_hosts))
 
-                success = generator.generate_inventory(output_path, output_type, host)
+        for host, success, in_content, is_valid in results:
+            with self.subTest(host=host):
                 self.assertTrue(success, f"Failed to generate inventory for host: {host}")
-
-                # Verify the host appears in the file
-                with open(output_path, 'r') as f:
-                    content = f.read()
-                self.assertIn(host, content)
-
-                # Validate the generated inventory
-                validator = InventoryValidator('containerized', 'growth')
-                is_valid = validator.validate_inventory(output_path)
+                self.assertTrue(in_content, f"Host missing from generated inventory: {host}")
                 self.assertTrue(is_valid, f"Generated inventory invalid for host: {host}")
 
 
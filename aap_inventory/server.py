@@ -1,13 +1,16 @@
 # server.py
-import inspect
+import functools
+import io
+import logging
 import os
-import tempfile
 from typing import Annotated, Literal
 from pydantic import Field
 from mcp.server import FastMCP
 
 from aap_inventory_tool import generate_command
 
+logger = logging.getLogger(__name__)
+
 PORT = int(os.getenv("PORT", "20000"))
 HOST = os.getenv("HOST", "127.0.0.1")
 
@@ -18,6 +21,40 @@ mcp = FastMCP(
 )
 
 
+class Args:
+    """Inventory generator arguments, shaped like the namespace returned by argparse.
+
+    There is no output_path: the server always generates into an in-memory stream, so no files are created.
+    """
+
+    __slots__ = (
+        "platform", "topology", "host",
+        "gateway_hosts", "controller_hosts", "hop_host", "execution_hosts", "hub_hosts", "eda_hosts",
+        "external_database",
+        "gateway_host", "controller_host", "execution_host", "hub_host", "eda_host", "database_host",
+        "redis",
+        "custom_ca_cert", "ca_tls_cert", "ca_tls_key",
+        "hub_signing_auto_sign", "hub_signing_require_content_approval",
+        "hub_signing_collection_key", "hub_signing_collection_pass",
+        "hub_signing_container_key", "hub_signing_container_pass",
+    )
+
+    def __init__(self, **kwargs):
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+
+# Arguments that hold a comma-delimited list of hosts
+LIST_ARGS = frozenset({
+    "gateway_hosts", "controller_hosts", "execution_hosts", "hub_hosts", "eda_hosts", "redis",
+})
+
+
+def _split_list(value: str) -> list[str]:
+    """Convert a comma-delimited string into a list, dropping empty entries."""
+    return [s for s in (t.strip() for t in value.split(",")) if s]
+
+
 @mcp.tool(
     name="get_inventory",
     description="Get AAP(Ansible Automation Patform) 2.5 inventory file in INI format.",
@@ -137,47 +174,65 @@ def get_inventory(
             Field(description='This is a dummy argument added only for llama-stack compatibility'),
         ] = '',
 ) -> str:
-    # Read arguments and convert them into the format used by Python's argparse.ArgumentParser
-    frame = inspect.currentframe()
-    args_dict = inspect.getargvalues(frame).locals
-
-    class Args:
-        pass
-
-    args = Args()
-    for k,v in args_dict.items():
-        # Ignore session_id, which is added only for Llama Stack compatibility.
-        if k != "session_id":
-            # Convert string properties that contain a comma-delimited list into a list.
-            if k == "redis" or k.endswith("_hosts") and v is not None:
-                v = [s.strip() for s in v.split(",") if s != ""]
-            setattr(args, k, v)
-
-    # Create temporary files for inventory and log
+    # session_id is ignored, as it is added only for Llama Stack compatibility.
     try:
-        with tempfile.NamedTemporaryFile(delete=False, mode="w") as inventory_file:
-            args.output_path = inventory_file.name
-            with tempfile.NamedTemporaryFile(delete=False, mode="w") as log:
-                # Generate an AAP inventory
-                rc = generate_command(args, log)
-
-                # If the inventory file was generated successfully, return it.
-                if rc == 0:
-                    with open(inventory_file.name) as f:
-                        output = f.read()
-                # Otherise, return the execution log.
-                else:
-                    log.flush()
-                    log.close()
-                    with open(log.name) as f:
-                        output = f.read()
-                        print(output)
-                return output
+        return _generate_inventory(
+            platform=platform,
+            topology=topology,
+            host=host,
+            gateway_hosts=gateway_hosts,
+            controller_hosts=controller_hosts,
+            hop_host=hop_host,
+            execution_hosts=execution_hosts,
+            hub_hosts=hub_hosts,
+            eda_hosts=eda_hosts,
+            external_database=external_database,
+            gateway_host=gateway_host,
+            controller_host=controller_host,
+            execution_host=execution_host,
+            hub_host=hub_host,
+            eda_host=eda_host,
+            database_host=database_host,
+            redis=redis,
+            custom_ca_cert=custom_ca_cert,
+            ca_tls_cert=ca_tls_cert,
+            ca_tls_key=ca_tls_key,
+            hub_signing_auto_sign=hub_signing_auto_sign,
+            hub_signing_require_content_approval=hub_signing_require_content_approval,
+            hub_signing_collection_key=hub_signing_collection_key,
+            hub_signing_collection_pass=hub_signing_collection_pass,
+            hub_signing_container_key=hub_signing_container_key,
+            hub_signing_container_pass=hub_signing_container_pass,
+        )
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         return f'An unexpected error occurred.'
 
 
+# Generation is deterministic, so identical tool calls (e.g. agent retries) are served from memory.
+@functools.lru_cache(maxsize=128)
+def _generate_inventory(**kwargs) -> str:
+    """Generate an inventory for the given tool arguments, or return the generation log on failure."""
+    # Convert arguments into the format used by Python's argparse.ArgumentParser
+    args = Args(**kwargs)
+
+    # Convert string properties that contain a comma-delimited list into a list.
+    for name in LIST_ARGS:
+        setattr(args, name, _split_list(getattr(args, name)))
+
+    # Generate an AAP inventory into in-memory buffers
+    inventory = io.StringIO()
+    log = io.StringIO()
+    rc = generate_command(args, log, out=inventory)
+
+    # If the inventory was generated successfully, return it.
+    if rc == 0:
+        return inventory.getvalue()
+
+    # Otherise, return the execution log.
+    output = log.getvalue()
+    logger.debug("Inventory generation failed:\n%s", output)
+    return output
 
 
 if __name__ == "__main__":
@@ -1,13 +1,23 @@
 import json
 import os
+import random
+import re
+import time
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import urljoin
 
 import httpx
 from fastmcp import FastMCP
 
+# Use orjson for decoding when it is installed; its JSONDecodeError subclasses the stdlib one
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,10 +38,34 @@ if not ANSIBLE_TOKEN:
 # Initialize FastMCP server
 mcp = FastMCP("Ansible Job Template Server")
 
+# Characters not allowed in MCP tool names generated from job template names
+TOOL_NAME_RE = re.compile(r'[^a-zA-Z0-9_]')
+
 # Global variables to cache job templates
 job_templates_cache: List[Dict[str, Any]] = []
+job_templates_cache_version = 0  # Incremented each time the cache is rebuilt
 templates_last_fetched: Optional[float] = None
-CACHE_TTL = 300  # 5 minutes cache TTL
+# (template count, latest modified timestamp) of the cached templates, used to detect changes
+templates_fingerprint: Optional[Tuple[int, Optional[str]]] = None
+CACHE_TTL = 300  # 5 minutes between checks for template changes
+# Background task revalidating the cache, if one is running
+templates_refresh_task: Optional[asyncio.Task] = None
+# list_job_templates output for the cache version it was built from
+templates_listing: List[Dict[str, Any]] = []
+templates_listing_version = -1
+SURVEY_SPEC_CONCURRENCY = 16  # Maximum survey spec requests in flight at once
+
+# Retries for transient AAP failures on (idempotent) GET requests
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5  # seconds; the upper bound of the random delay doubles with each attempt
+
+# Recently fetched job statuses: job ID -> (time fetched, status)
+job_status_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+JOB_STATUS_TTL = 5  # seconds a running job's status is reused
+JOB_STATUS_CACHE_SIZE = 1024
+# A job in one of these states will not change again, so its status is reused indefinitely
+TERMINAL_JOB_STATUSES = frozenset({"successful", "failed", "error", "canceled"})
 
 
 def parse_extra_vars(extra_vars: Optional[str]) -> Optional[Dict[str, Any]]:
@@ -52,7 +86,7 @@ def parse_extra_vars(extra_vars: Optional[str]) -> Optional[Dict[str, Any]]:
         
     try:
         # Log the raw extra_vars for debugging
-        logger.debug(f"Raw extra_vars received: {repr(extra_vars)}")
+        logger.debug("Raw extra_vars received: %r", extra_vars)
         
         # Clean up common issues with malformed JSON
         cleaned_extra_vars = extra_vars.strip()
@@ -67,13 +101,13 @@ def parse_extra_vars(extra_vars: Optional[str]) -> Optional[Dict[str, Any]]:
             json_part = cleaned_extra_vars.replace("[object Object]", "").strip()
             if json_part:
                 cleaned_extra_vars = json_part
-                logger.debug(f"Cleaned [object Object] prefix, extracted: {repr(cleaned_extra_vars)}")
+                logger.debug("Cleaned [object Object] prefix, extracted: %r", cleaned_extra_vars)
             else:
                 # If nothing left after removing [object Object], return None
                 return None
         
-        parsed_extra_vars = json.loads(cleaned_extra_vars)
-        logger.debug(f"Successfully parsed extra_vars: {parsed_extra_vars}")
+        parsed_extra_vars = json_loads(cleaned_extra_vars)
+        logger.debug("Successfully parsed extra_vars: %s", parsed_extra_vars)
         return parsed_extra_vars
         
     except json.JSONDecodeError as e:
@@ -82,6 +116,13 @@ def parse_extra_vars(extra_vars: Optional[str]) -> Optional[Dict[str, Any]]:
         raise ValueError(f"Invalid JSON in extra_vars: {e}. Received: {repr(extra_vars)}")
 
 
+def count_lines(text: str) -> int:
+    """Count the lines in text without building a list of them (a final line need not end in a newline)"""
+    if not text:
+        return 0
+    return text.count("\n") + (not text.endswith("\n"))
+
+
 class AnsibleClient:
     """Client for interacting with Ansible AWX/Controller API"""
     
@@ -100,146 +141,187 @@ class AnsibleClient:
         else:
             self.api_prefix = "/api/controller"
         
+        # Shared HTTP client so connections (and TLS sessions) are reused across API calls.
+        # HTTP/2 lets concurrent requests (e.g. survey spec fetches) share one connection.
+        # Created lazily because it must belong to the event loop that uses it.
+        self._client: Optional[httpx.AsyncClient] = None
+        
         logger.info(f"Initialized Ansible client for AAP version {aap_version} with API prefix: {self.api_prefix}")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(headers=self.headers, timeout=httpx.Timeout(30.0), http2=True)
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET a URL, retrying transport errors and transient HTTP statuses with exponential backoff and jitter"""
+        client = self._get_client()
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await client.get(url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                logger.warning("Request to %s failed (%s), retrying", url, e)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                    return response
+                logger.warning("Request to %s returned %s, retrying", url, response.status_code)
+            await asyncio.sleep(random.uniform(0, RETRY_BACKOFF * 2 ** attempt))
+    
     async def get_job_templates(self, page_size: int = 200) -> List[Dict[str, Any]]:
         """Fetch all job templates from Ansible (handling pagination)"""
         all_templates = []
         page = 1
         total_count = None
         
-        async with httpx.AsyncClient() as client:
-            base_url = urljoin(self.base_url, f"{self.api_prefix}/v2/job_templates/")
+        base_url = urljoin(self.base_url, f"{self.api_prefix}/v2/job_templates/")
+        
+        logger.info(f"Fetching job templates from {base_url} with page_size={page_size}")
+        
+        while True:
+            # Construct URL with pagination parameters
+            params = {
+                "page_size": page_size,
+                "page": page
+            }
             
-            logger.info(f"Fetching job templates from {base_url} with page_size={page_size}")
+            logger.debug("Fetching page %d (page_size=%d)", page, page_size)
             
-            while True:
-                # Construct URL with pagination parameters
-                params = {
-                    "page_size": page_size,
-                    "page": page
-                }
+            try:
+                response = await self._get(base_url, params=params)
+                response.raise_for_status()
                 
-                logger.debug(f"Fetching page {page} (page_size={page_size})")
+                data = json_loads(response.content)
+                page_results = data.get("results", [])
                 
-                try:
-                    response = await client.get(base_url, headers=self.headers, params=params)
-                    response.raise_for_status()
-                    
-                    data = response.json()
-                    page_results = data.get("results", [])
-                    
-                    # Get total count from first page
-                    if total_count is None:
-                        total_count = data.get("count", 0)
-                        logger.info(f"Total job templates available: {total_count}")
-                    
-                    all_templates.extend(page_results)
-                    
-                    logger.debug(f"Page {page}: {len(page_results)} templates, total fetched: {len(all_templates)}/{total_count}")
-                    
-                    # Check if we have more pages
-                    if not data.get("next") or len(page_results) == 0:
-                        break
-                    
-                    page += 1
-                    
-                except httpx.HTTPStatusError as e:
-                    logger.error(f"HTTP error fetching job templates page {page}: {e}")
-                    if page == 1:
-                        # If first page fails, re-raise the error
-                        raise
-                    else:
-                        # If subsequent page fails, log and break (we have partial data)
-                        logger.warning(f"Stopping pagination due to error on page {page}")
-                        break
-                except Exception as e:
-                    logger.error(f"Unexpected error fetching job templates page {page}: {e}")
-                    if page == 1:
-                        raise
-                    else:
-                        break
-            
-            logger.info(f"Successfully fetched {len(all_templates)} job templates across {page-1} pages")
-            return all_templates
+                # Get total count from first page
+                if total_count is None:
+                    total_count = data.get("count", 0)
+                    logger.info(f"Total job templates available: {total_count}")
+                
+                all_templates.extend(page_results)
+                
+                logger.debug("Page %d: %d templates, total fetched: %d/%s", page, len(page_results), len(all_templates), total_count)
+                
+                # Check if we have more pages
+                if not data.get("next") or len(page_results) == 0:
+                    break
+                
+                page += 1
+                
+            except httpx.HTTPStatusError as e:
+                logger.error(f"HTTP error fetching job templates page {page}: {e}")
+                if page == 1:
+                    # If first page fails, re-raise the error
+                    raise
+                else:
+                    # If subsequent page fails, log and break (we have partial data)
+                    logger.warning(f"Stopping pagination due to error on page {page}")
+                    break
+            except Exception as e:
+                logger.error(f"Unexpected error fetching job templates page {page}: {e}")
+                if page == 1:
+                    raise
+                else:
+                    break
+        
+        logger.info(f"Successfully fetched {len(all_templates)} job templates across {page-1} pages")
+        return all_templates
+    
+    async def get_job_templates_fingerprint(self) -> Tuple[int, Optional[str]]:
+        """Get the job template count and latest modified timestamp with a single one-item page"""
+        url = urljoin(self.base_url, f"{self.api_prefix}/v2/job_templates/")
+        
+        logger.debug("Checking job templates for changes")
+        response = await self._get(url, params={"page_size": 1, "order_by": "-modified"})
+        response.raise_for_status()
+        
+        data = json_loads(response.content)
+        results = data.get("results", [])
+        return data.get("count", 0), results[0].get("modified") if results else None
     
     async def launch_job_template(self, template_id: int, extra_vars: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Launch a specific job template"""
-        async with httpx.AsyncClient() as client:
-            url = urljoin(self.base_url, f"{self.api_prefix}/v2/job_templates/{template_id}/launch/")
-            
-            payload = {}
-            if extra_vars:
-                payload["extra_vars"] = extra_vars
-            
-            logger.info(f"Launching job template {template_id} at {url}")
-            response = await client.post(url, headers=self.headers, json=payload)
-            response.raise_for_status()
-            
-            return response.json()
+        client = self._get_client()
+        url = urljoin(self.base_url, f"{self.api_prefix}/v2/job_templates/{template_id}/launch/")
+        
+        payload = {}
+        if extra_vars:
+            payload["extra_vars"] = extra_vars
+        
+        logger.info(f"Launching job template {template_id} at {url}")
+        response = await client.post(url, json=payload)
+        response.raise_for_status()
+        
+        return json_loads(response.content)
     
     async def get_job_status(self, job_id: int) -> Dict[str, Any]:
         """Get status of a specific job"""
-        async with httpx.AsyncClient() as client:
-            url = urljoin(self.base_url, f"{self.api_prefix}/v2/jobs/{job_id}/")
-            
-            logger.info(f"Getting job status for job {job_id}")
-            response = await client.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            return response.json()
+        url = urljoin(self.base_url, f"{self.api_prefix}/v2/jobs/{job_id}/")
+        
+        logger.info(f"Getting job status for job {job_id}")
+        response = await self._get(url)
+        response.raise_for_status()
+        
+        return json_loads(response.content)
     
     async def get_job_template_survey_spec(self, template_id: int) -> Optional[Dict[str, Any]]:
         """Get survey specification for a specific job template"""
-        async with httpx.AsyncClient() as client:
-            url = urljoin(self.base_url, f"{self.api_prefix}/v2/job_templates/{template_id}/survey_spec/")
+        url = urljoin(self.base_url, f"{self.api_prefix}/v2/job_templates/{template_id}/survey_spec/")
+        
+        logger.debug("Fetching survey spec for job template %s", template_id)
+        try:
+            response = await self._get(url)
+            response.raise_for_status()
             
-            logger.debug(f"Fetching survey spec for job template {template_id}")
-            try:
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
-                
-                survey_data = response.json()
-                logger.debug(f"Successfully fetched survey spec for template {template_id}")
-                return survey_data
-                
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    # Survey spec not found - this is normal for templates without surveys
-                    logger.debug(f"No survey spec found for job template {template_id} (404)")
-                    return None
-                else:
-                    logger.warning(f"Error fetching survey spec for template {template_id}: {e}")
-                    raise
-            except Exception as e:
-                logger.warning(f"Unexpected error fetching survey spec for template {template_id}: {e}")
+            survey_data = json_loads(response.content)
+            logger.debug("Successfully fetched survey spec for template %s", template_id)
+            return survey_data
+            
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                # Survey spec not found - this is normal for templates without surveys
+                logger.debug("No survey spec found for job template %s (404)", template_id)
                 return None
+            else:
+                logger.warning(f"Error fetching survey spec for template {template_id}: {e}")
+                raise
+        except Exception as e:
+            logger.warning(f"Unexpected error fetching survey spec for template {template_id}: {e}")
+            return None
     
     async def get_job_stdout(self, job_id: int) -> str:
         """Get the stdout log of a specific job"""
-        async with httpx.AsyncClient() as client:
-            url = urljoin(self.base_url, f"{self.api_prefix}/v2/jobs/{job_id}/stdout/")
+        url = urljoin(self.base_url, f"{self.api_prefix}/v2/jobs/{job_id}/stdout/")
+        
+        logger.info(f"Fetching stdout log for job {job_id}")
+        try:
+            response = await self._get(url)
+            response.raise_for_status()
             
-            logger.info(f"Fetching stdout log for job {job_id}")
-            try:
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
-                
-                # The stdout endpoint returns plain text, not JSON
-                stdout_content = response.text
-                logger.debug(f"Successfully fetched stdout log for job {job_id} ({len(stdout_content)} characters)")
-                return stdout_content
-                
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    logger.warning(f"Job {job_id} not found or stdout not available")
-                    raise ValueError(f"Job {job_id} not found or stdout log not available")
-                else:
-                    logger.error(f"Error fetching stdout for job {job_id}: {e}")
-                    raise
-            except Exception as e:
-                logger.error(f"Unexpected error fetching stdout for job {job_id}: {e}")
+            # The stdout endpoint returns plain text, not JSON
+            stdout_content = response.text
+            logger.debug("Successfully fetched stdout log for job %s (%d characters)", job_id, len(stdout_content))
+            return stdout_content
+            
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"Job {job_id} not found or stdout not available")
+                raise ValueError(f"Job {job_id} not found or stdout log not available")
+            else:
+                logger.error(f"Error fetching stdout for job {job_id}: {e}")
                 raise
+        except Exception as e:
+            logger.error(f"Unexpected error fetching stdout for job {job_id}: {e}")
+            raise
 
 
 # Initialize Ansible client
@@ -248,46 +330,51 @@ ansible_client = AnsibleClient(ANSIBLE_BASE_URL, ANSIBLE_TOKEN, AAP_VERSION)
 
 async def fetch_and_cache_templates():
     """Fetch job templates with their survey specs and cache them"""
-    global job_templates_cache, templates_last_fetched
-    import time
+    global job_templates_cache, job_templates_cache_version, templates_last_fetched, templates_fingerprint
     
     try:
         # Fetch all job templates (with pagination)
         templates = await ansible_client.get_job_templates()
         logger.info(f"📋 Discovered {len(templates)} job templates total")
         
-        # Fetch survey specs for each template
+        # Fetch survey specs for all templates concurrently, with a bounded number in flight.
+        # The fetched template dicts are not used elsewhere, so survey specs are added in place.
         logger.info("Fetching survey specifications for job templates...")
-        templates_with_surveys = []
-        survey_count = 0
+        semaphore = asyncio.Semaphore(SURVEY_SPEC_CONCURRENCY)
         
-        for template in templates:
+        async def fetch_survey_spec(template):
             template_id = template.get("id")
             template_name = template.get("name", f"template_{template_id}")
             
-            # Copy the template data
-            enhanced_template = template.copy()
-            
             try:
                 # Fetch survey spec for this template
-                survey_spec = await ansible_client.get_job_template_survey_spec(template_id)
+                async with semaphore:
+                    survey_spec = await ansible_client.get_job_template_survey_spec(template_id)
                 if survey_spec:
-                    enhanced_template["survey_spec"] = survey_spec
-                    survey_count += 1
-                    logger.debug(f"Added survey spec for template '{template_name}' ({template_id})")
+                    template["survey_spec"] = survey_spec
+                    logger.debug("Added survey spec for template '%s' (%s)", template_name, template_id)
                 else:
-                    enhanced_template["survey_spec"] = None
-                    logger.debug(f"No survey spec for template '{template_name}' ({template_id})")
+                    template["survey_spec"] = None
+                    logger.debug("No survey spec for template '%s' (%s)", template_name, template_id)
                     
             except Exception as e:
                 logger.warning(f"Failed to fetch survey spec for template '{template_name}' ({template_id}): {e}")
-                enhanced_template["survey_spec"] = None
+                template["survey_spec"] = None
             
-            templates_with_surveys.append(enhanced_template)
+            return template
+        
+        # gather preserves the order of the templates
+        templates_with_surveys = list(await asyncio.gather(*(fetch_survey_spec(t) for t in templates)))
+        survey_count = sum(1 for t in templates_with_surveys if t["survey_spec"])
         
         # Cache the enhanced templates
         job_templates_cache = templates_with_surveys
+        job_templates_cache_version += 1
         templates_last_fetched = time.time()
+        templates_fingerprint = (
+            len(templates),
+            max((t.get("modified") for t in templates if t.get("modified")), default=None),
+        )
         
         logger.info(f"Cached {len(templates_with_surveys)} job templates with {survey_count} survey specifications")
         return templates_with_surveys
@@ -297,20 +384,90 @@ async def fetch_and_cache_templates():
         raise
 
 
+async def templates_changed() -> bool:
+    """Check whether job templates were added, removed or modified since they were cached"""
+    try:
+        return await ansible_client.get_job_templates_fingerprint() != templates_fingerprint
+    except Exception as e:
+        logger.warning(f"Failed to check job templates for changes, refetching: {e}")
+        return True
+
+
+async def revalidate_templates():
+    """Refetch job templates if they have changed, otherwise mark the cache as fresh"""
+    global templates_last_fetched
+    
+    try:
+        # A single cheap request decides whether the full refetch (one request per template) is needed
+        if await templates_changed():
+            await fetch_and_cache_templates()
+        else:
+            templates_last_fetched = time.time()
+    except Exception as e:
+        # Keep serving the existing cache; the next call will schedule another attempt
+        logger.warning(f"Background refresh of job templates failed: {e}")
+
+
 async def get_cached_templates():
-    """Get job templates from cache or fetch if needed"""
-    global job_templates_cache, templates_last_fetched
-    import time
+    """Get job templates from cache, fetching them only if nothing is cached yet
+
+    An expired cache is still returned immediately while it is revalidated in the background.
+    """
+    global templates_refresh_task
     
     current_time = time.time()
     
-    # Check if cache is empty or expired
-    if not job_templates_cache or not templates_last_fetched or (current_time - templates_last_fetched) > CACHE_TTL:
+    if not job_templates_cache or not templates_last_fetched:
         await fetch_and_cache_templates()
+    elif (current_time - templates_last_fetched) > CACHE_TTL:
+        if templates_refresh_task is None or templates_refresh_task.done():
+            templates_refresh_task = asyncio.create_task(revalidate_templates())
     
     return job_templates_cache
 
 
+# Survey question types whose choices are included in the template listing
+CHOICE_QUESTION_TYPES = frozenset({"multiplechoice", "multiselect"})
+
+
+def summarize_job_template(template: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the simplified view of a cached job template returned by list_job_templates"""
+    template_name = template.get("name", f"template_{template.get('id')}")
+    tool_name = TOOL_NAME_RE.sub('_', template_name.lower())
+    
+    # Get survey spec info if available
+    survey_questions = []
+    if (survey_spec := template.get("survey_spec")) and isinstance(survey_spec, dict):
+        spec_data = survey_spec.get("spec", [])
+        if isinstance(spec_data, list):
+            survey_questions = [
+                {
+                    "variable": q.get("variable"),
+                    "question_name": q.get("question_name"),
+                    "type": q.get("type"),
+                    "required": q.get("required", False),
+                    "default": q.get("default", ""),
+                    "choices": q.get("choices", []) if q.get("type") in CHOICE_QUESTION_TYPES else []
+                }
+                for q in spec_data if isinstance(q, dict)
+            ]
+
+    summary_fields = template.get("summary_fields", {})
+    return {
+        "id": template.get("id"),
+        "name": template.get("name"),
+        "description": template.get("description", ""),
+        "survey_enabled": template.get("survey_enabled", False),
+        "variables": template.get("extra_vars", ""),
+        "ask_variables_on_launch": template.get("ask_variables_on_launch", False),
+        "inventory": summary_fields.get("inventory", {}),
+        "project": summary_fields.get("project", {}),
+        "survey_questions": survey_questions,  # Include survey questions
+        "has_survey": bool(survey_questions),  # Boolean flag for convenience
+        "mcp_tool_name": tool_name,  # Include the MCP tool name
+    }
+
+
 async def list_job_templates() -> List[Dict[str, Any]]:
     """
     List all available Ansible job templates.
@@ -321,51 +478,38 @@ async def list_job_templates() -> List[Dict[str, Any]]:
     Returns:
         List of job templates with their details including id, name, description, and variables.
     """
+    global templates_listing, templates_listing_version
     templates = await get_cached_templates()
     
+    # Reuse the listing built from this version of the cache
+    if templates_listing_version == job_templates_cache_version:
+        return templates_listing
+    
     # Return simplified template information
-    result = []
-    for template in templates:
-        template_name = template.get("name", f"template_{template.get('id')}")
-        import re
-        tool_name = re.sub(r'[^a-zA-Z0-9_]', '_', template_name.lower())
-        tool_name = f"{tool_name}"
-        
-        # Get survey spec info if available
-        survey_spec = template.get("survey_spec")
-        survey_questions = []
-        if survey_spec and isinstance(survey_spec, dict):
-            spec_data = survey_spec.get("spec", [])
-            if isinstance(spec_data, list):
-                survey_questions = [
-                    {
-                        "variable": q.get("variable"),
-                        "question_name": q.get("question_name"),
-                        "type": q.get("type"),
-                        "required": q.get("required", False),
-                        "default": q.get("default", ""),
-                        "choices": q.get("choices", []) if q.get("type") in ["multiplechoice", "multiselect"] else []
-                    }
-                    for q in spec_data if isinstance(q, dict)
-                ]
-
-        result.append({
-            "id": template.get("id"),
-            "name": template.get("name"),
-            "description": template.get("description", ""),
-            "survey_enabled": template.get("survey_enabled", False),
-            "variables": template.get("extra_vars", ""),
-            "ask_variables_on_launch": template.get("ask_variables_on_launch", False),
-            "inventory": template.get("summary_fields", {}).get("inventory", {}),
-            "project": template.get("summary_fields", {}).get("project", {}),
-            "survey_questions": survey_questions,  # Include survey questions
-            "has_survey": bool(survey_questions),  # Boolean flag for convenience
-            "mcp_tool_name": tool_name,  # Include the MCP tool name
-        })
+    result = [summarize_job_template(template) for template in templates]
     
+    templates_listing = result
+    templates_listing_version = job_templates_cache_version
     return result
 
 
+async def fetch_job_status(job_id: int, use_cache: bool = True) -> Dict[str, Any]:
+    """Get a job's status, reusing a recently fetched (or final) status when use_cache is set"""
+    if use_cache:
+        cached = job_status_cache.get(job_id)
+        if cached:
+            fetched_at, status = cached
+            if status.get("status") in TERMINAL_JOB_STATUSES or time.time() - fetched_at < JOB_STATUS_TTL:
+                return status
+    
+    status = await ansible_client.get_job_status(job_id)
+    if job_id not in job_status_cache and len(job_status_cache) >= JOB_STATUS_CACHE_SIZE:
+        # Evict the oldest entry
+        del job_status_cache[next(iter(job_status_cache))]
+    job_status_cache[job_id] = (time.time(), status)
+    return status
+
+
 # @mcp.tool()
 async def launch_job_template(template_id: int, extra_vars: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -407,7 +551,8 @@ async def get_job_status(job_id: int) -> Dict[str, Any]:
         Job status details including current state, progress, and results.
     """
     try:
-        result = await ansible_client.get_job_status(job_id)
+        # Always fetch so that polling sees state changes; this also refreshes the cache for get_job_logs
+        result = await fetch_job_status(job_id, use_cache=False)
         return {
             "id": result.get("id"),
             "name": result.get("name"),
@@ -439,11 +584,11 @@ async def get_job_logs(job_id: int) -> Dict[str, Any]:
         Job logs with metadata including log content, job ID, and content length.
     """
     try:
-        # First get job status to provide context
-        job_status = await ansible_client.get_job_status(job_id)
-        
-        # Get the stdout logs
-        stdout_content = await ansible_client.get_job_stdout(job_id)
+        # Get the job status (for context) and the stdout logs concurrently; neither depends on the other
+        job_status, stdout_content = await asyncio.gather(
+            fetch_job_status(job_id),
+            ansible_client.get_job_stdout(job_id),
+        )
         
         return {
             "job_id": job_id,
@@ -454,7 +599,7 @@ async def get_job_logs(job_id: int) -> Dict[str, Any]:
             "finished": job_status.get("finished"),
             "stdout_content": stdout_content,
             "log_length": len(stdout_content),
-            "log_lines": len(stdout_content.splitlines()) if stdout_content else 0,
+            "log_lines": count_lines(stdout_content),
         }
     except Exception as e:
         logger.error(f"Failed to get job logs for job {job_id}: {e}")
@@ -496,9 +641,7 @@ def create_job_template_tool_with_decorator(template):
     template_description = template.get("description", f"Launch job template: {template_name}")
     
     # Clean template name for tool name (replace spaces and special chars with underscores)
-    import re
-    tool_name = re.sub(r'[^a-zA-Z0-9_]', '_', template_name.lower())
-    tool_name = f"{tool_name}"
+    tool_name = TOOL_NAME_RE.sub('_', template_name.lower())
 
     # Get survey information
     survey_spec = template.get("survey_spec")
@@ -561,9 +704,7 @@ def create_job_template_tool(template):
     template_description = template.get("description", f"Launch job template: {template_name}")
     
     # Clean template name for tool name (replace spaces and special chars with underscores)
-    import re
-    tool_name = re.sub(r'[^a-zA-Z0-9_]', '_', template_name.lower())
-    tool_name = f"{tool_name}"
+    tool_name = TOOL_NAME_RE.sub('_', template_name.lower())
 
     # Get survey information
     survey_spec = template.get("survey_spec")
@@ -650,7 +791,7 @@ async def initialize_server():
                 # Register the tool directly using the decorator approach during server initialization
                 tool_name, tool_func = create_job_template_tool_with_decorator(template)
                 created_tools += 1
-                logger.debug(f"   ✓ Created tool: {tool_name} → '{template.get('name')}'")
+                logger.debug("   ✓ Created tool: %s → '%s'", tool_name, template.get('name'))
             except Exception as e:
                 logger.warning(f"   ⚠️ Failed to create tool for template {template.get('id', 'unknown')}: {e}")
         
@@ -663,25 +804,41 @@ async def initialize_server():
 
 
 def start():
+    # Use uvloop's faster event loop where it is available (it does not support Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+    
+    asyncio.run(serve())
+
+
+async def serve():
+    """Initialize and run the server on one event loop, so the warm AAP connection pool is kept"""
     # Initialize the server before running
     try:
-        import asyncio
-        asyncio.run(initialize_server())
+        await initialize_server()
     except Exception as e:
         logger.warning(f"Failed to initialize server: {e}")
         logger.info("Server will start but templates may not be available until first request")
     
     # Run the server with the specified transport
-    if MCP_TRANSPORT.lower() == "http":
-        logger.info(f"Starting MCP server on http://{MCP_HOST}:{MCP_PORT}/mcp")
-        mcp.run(transport="http", host=MCP_HOST, port=MCP_PORT, path="/mcp")
-    elif MCP_TRANSPORT.lower() == "sse":
-        logger.info(f"Starting MCP server with SSE on {MCP_HOST}:{MCP_PORT}")
-        mcp.run(transport="sse", host=MCP_HOST, port=MCP_PORT)
-    else:
-        # Default to stdio transport
-        logger.info("Starting MCP server with STDIO transport")
-        mcp.run() 
+    try:
+        if MCP_TRANSPORT.lower() == "http":
+            logger.info(f"Starting MCP server on http://{MCP_HOST}:{MCP_PORT}/mcp")
+            await mcp.run_async(transport="http", host=MCP_HOST, port=MCP_PORT, path="/mcp")
+        elif MCP_TRANSPORT.lower() == "sse":
+            logger.info(f"Starting MCP server with SSE on {MCP_HOST}:{MCP_PORT}")
+            await mcp.run_async(transport="sse", host=MCP_HOST, port=MCP_PORT)
+        else:
+            # Default to stdio transport
+            logger.info("Starting MCP server with STDIO transport")
+            await mcp.run_async()
+    finally:
+        await ansible_client.aclose()
+
 
 if __name__ == "__main__":
     start()
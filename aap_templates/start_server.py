@@ -14,20 +14,22 @@ def load_env_file(env_file_path: str):
     if not os.path.exists(env_file_path):
         return False
     
-    with open(env_file_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+    updates = {}
+    for line in Path(env_file_path).read_text().splitlines():
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+        key, sep, value = line.partition('=')
+        if sep:
+            updates[key.strip()] = value.strip()
+    os.environ.update(updates)
     
     return True
 
 
 def main():
     """Main startup function"""
-    print("🚀 Starting Ansible MCP Playbook Server...")
+    lines = ["🚀 Starting Ansible MCP Playbook Server..."]
     
     # Try to load environment variables from file
     env_files = ['.env', 'env', 'env.example']
@@ -35,12 +37,13 @@ def main():
     
     for env_file in env_files:
         if load_env_file(env_file):
-            print(f"✅ Loaded environment variables from: {env_file}")
+            lines.append(f"✅ Loaded environment variables from: {env_file}")
             env_loaded = True
             break
     
     if not env_loaded:
-        print("ℹ️  No environment file found. Using system environment variables.")
+        lines.append("ℹ️  No environment file found. Using system environment variables.")
+    print(*lines, sep="\n")
     
     # Check required environment variables
     required_vars = ['ANSIBLE_BASE_URL', 'ANSIBLE_TOKEN']
@@ -51,30 +54,31 @@ def main():
             missing_vars.append(var)
     
     if missing_vars:
-        print("❌ Missing required environment variables:")
-        for var in missing_vars:
-            print(f"   - {var}")
-        print("\nPlease set these environment variables or create an .env file.")
-        print("See env.example for reference.")
+        lines = ["❌ Missing required environment variables:"]
+        lines.extend(f"   - {var}" for var in missing_vars)
+        lines.append("\nPlease set these environment variables or create an .env file.")
+        lines.append("See env.example for reference.")
+        print(*lines, sep="\n")
         sys.exit(1)
     
     transport=os.getenv('MCP_TRANSPORT', "stdio")
     host=os.getenv('MCP_HOST', "0.0.0.0")
     port=int(os.getenv('MCP_PORT', "8200"))
     # Display configuration
-    print("\n📋 Configuration:")
-    print(f"   Ansible Base URL: {os.getenv('ANSIBLE_BASE_URL')}")
+    lines = ["\n📋 Configuration:"]
+    lines.append(f"   Ansible Base URL: {os.getenv('ANSIBLE_BASE_URL')}")
     aap_version = os.getenv('AAP_VERSION', '2.4')
-    print(f"   AAP Version: {aap_version}")
+    lines.append(f"   AAP Version: {aap_version}")
     api_prefix = "/api" if aap_version == "2.4" else "/api/controller"
-    print(f"   API Prefix: {api_prefix}")
-    print(f"   MCP Transport: {transport}")
+    lines.append(f"   API Prefix: {api_prefix}")
+    lines.append(f"   MCP Transport: {transport}")
     if os.getenv('MCP_TRANSPORT', 'stdio').lower() in ['http', 'sse']:
-        print(f"   MCP Host: {host}")
-        print(f"   MCP Port: {port}")
-    print(f"   Token: {'*' * len(os.getenv('ANSIBLE_TOKEN', '')[:8])}...")
+        lines.append(f"   MCP Host: {host}")
+        lines.append(f"   MCP Port: {port}")
+    lines.append(f"   Token: {'*' * len(os.getenv('ANSIBLE_TOKEN', '')[:8])}...")
     
-    print("\n🎯 Starting server...")
+    lines.append("\n🎯 Starting server...")
+    print(*lines, sep="\n", flush=True)
     
     # Import and run the server
     from server import start
@@ -18,12 +18,22 @@ logger = get_logger(__name__)
 class LightspeedAuthenticationBackend(AuthenticationBackend):
     def __init__(self, authentication_validators: List[AuthenticationValidator]):
         self._authentication_validators = authentication_validators
+        # validators that declare a header only authenticate requests carrying it
+        self._validator_headers = [
+            getattr(validator, "AUTHENTICATION_HEADER_NAME", None)
+            for validator in authentication_validators
+        ]
 
     async def authenticate(
         self, conn: HTTPConnection
     ) -> tuple[AuthCredentials, BaseUser] | None:
         logger.debug(">>>>>>  call authentication backend authenticate")
-        for validator in self._authentication_validators:
+        headers = conn.headers
+        for validator, header_name in zip(
+            self._authentication_validators, self._validator_headers
+        ):
+            if header_name is not None and header_name not in headers:
+                continue
             value = await validator.validate(conn)
             if value is not None:
                 return value
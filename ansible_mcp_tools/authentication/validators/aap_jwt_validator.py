@@ -1,6 +1,14 @@
-import httpx
+import asyncio
 
-import jwt
+import hashlib
+
+import os
+
+import time
+
+import weakref
+
+from concurrent.futures import ThreadPoolExecutor
 
 import cachetools
 
@@ -25,30 +33,113 @@ from starlette.requests import HTTPConnection
 
 from ansible_mcp_tools.authentication.context import auth_context_var
 
+from ansible_mcp_tools import utils
+
 logger = get_logger(__name__)
 
 
-_cache = cachetools.TTLCache(maxsize=100, ttl=600)
+DECRYPTION_KEY_TTL = 600
+
+DECRYPTION_KEY_REFRESH = 540
+
+# url -> (future resolving to the public key, loop time after which it is stale)
+_decryption_keys: dict[str, tuple[asyncio.Future, float]] = {}
+_decryption_keys_lock = asyncio.Lock()
+_decryption_key_refresh_tasks: set[asyncio.Task] = set()
+
+TOKEN_CACHE_TTL = 600
+
+
+def _token_ttu(_key, token_data, now):
+    # never keep decoded claims past the token's own expiry
+    return min(token_data["exp"], now + TOKEN_CACHE_TTL)
+
+
+_token_cache = cachetools.TLRUCache(maxsize=10_000, ttu=_token_ttu, timer=time.time)
+# one lock per token being decoded, dropped once no request is waiting on it
+_token_cache_locks: weakref.WeakValueDictionary[bytes, asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+# RS256 verification is CPU bound, keep it off the event loop
+_jwt_decode_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="jwt-decode"
+)
 
 
 class AAPJWTValidator(AAPBaseValidator):
     AUTHENTICATION_HEADER_NAME = "X-DAB-JW-TOKEN"
 
+    async def _fetch_decryption_key(self, url: str) -> str:
+        logger.debug("calling authentication server at url: %s", url)
+        client = utils.get_http_client(self._verify_cert)
+        response = await client.get(url)
+        if not response.is_success:
+            raise AuthenticationError("failed to retrieve decryption key from AAP")
+        return response.text
+
+    async def _refresh_decryption_key(self, url: str):
+        loop = asyncio.get_running_loop()
+        try:
+            public_key = await self._fetch_decryption_key(url)
+        except Exception as exp:
+            # keep serving the current key until it goes stale
+            logger.warning("failed to refresh the jwt public key: %s", exp)
+            return
+        future = loop.create_future()
+        future.set_result(public_key)
+        _decryption_keys[url] = (future, loop.time() + DECRYPTION_KEY_TTL)
+        self._schedule_decryption_key_refresh(url)
+
+    def _schedule_decryption_key_refresh(self, url: str):
+        loop = asyncio.get_running_loop()
+
+        def _refresh():
+            task = loop.create_task(self._refresh_decryption_key(url))
+            _decryption_key_refresh_tasks.add(task)
+            task.add_done_callback(_decryption_key_refresh_tasks.discard)
+
+        loop.call_later(DECRYPTION_KEY_REFRESH, _refresh)
+
     async def _get_decryption_key(self) -> str:
         url = urljoin(self._authentication_server_url, "api/gateway/v1/jwt_key/")
-        public_key = _cache.get(url)
-        if public_key:
-            return public_key
-        logger.debug("calling authentication server at url: %s", url)
-        async with httpx.AsyncClient(verify=self._verify_cert) as client:
-            response = await client.get(url)
-            if not response.is_success:
-                raise AuthenticationError("failed to retrieve decryption key from AAP")
-            public_key = response.text
-            _cache[url] = public_key
-            return public_key
+        loop = asyncio.get_running_loop()
+        entry = _decryption_keys.get(url)
+        if entry and entry[1] > loop.time():
+            return await asyncio.shield(entry[0])
+
+        async with _decryption_keys_lock:
+            entry = _decryption_keys.get(url)
+            if entry and entry[1] > loop.time():
+                future = entry[0]
+            else:
+                future = None
+                owned_future = loop.create_future()
+                _decryption_keys[url] = (
+                    owned_future,
+                    loop.time() + DECRYPTION_KEY_TTL,
+                )
+        if future is not None:
+            return await asyncio.shield(future)
+
+        try:
+            public_key = await self._fetch_decryption_key(url)
+        except BaseException as exp:
+            # never leave a pending future behind, later callers would wait on it
+            _decryption_keys.pop(url, None)
+            if isinstance(exp, asyncio.CancelledError):
+                exp = AuthenticationError("decryption key fetch was cancelled")
+            owned_future.set_exception(exp)
+            # mark the exception retrieved when no one else is waiting
+            owned_future.exception()
+            raise
+        owned_future.set_result(public_key)
+        self._schedule_decryption_key_refresh(url)
+        return public_key
 
     def decode_jwt_token(self, unencrypted_token, decryption_key):
+        import jwt
+
         options = {"require": ["user_data", "exp"]}
         return jwt.decode(
             unencrypted_token,
@@ -59,6 +150,39 @@ class AAPJWTValidator(AAPBaseValidator):
             algorithms=["RS256"],
         )
 
+    async def _get_jwt_token_data(self, authentication_header_value: str) -> dict:
+        key = hashlib.blake2b(
+            authentication_header_value.encode(), digest_size=16
+        ).digest()
+        jwt_token_data = _token_cache.get(key)
+        if jwt_token_data is not None:
+            return jwt_token_data
+        lock = _token_cache_locks.get(key)
+        if lock is None:
+            lock = _token_cache_locks[key] = asyncio.Lock()
+        async with lock:
+            jwt_token_data = _token_cache.get(key)
+            if jwt_token_data is not None:
+                return jwt_token_data
+            try:
+                decryption_key = await self._get_decryption_key()
+            except Exception as exp:
+                logger.error("failed to get the jwt public key: %s", exp)
+                raise AuthenticationError("failed to get the jwt public key")
+
+            try:
+                jwt_token_data = await asyncio.get_running_loop().run_in_executor(
+                    _jwt_decode_executor,
+                    self.decode_jwt_token,
+                    authentication_header_value,
+                    decryption_key,
+                )
+            except Exception as exp:
+                logger.error("failed to decode jwt token: %s", exp)
+                raise AuthenticationError("failed to decode jwt token")
+            _token_cache[key] = jwt_token_data
+            return jwt_token_data
+
     async def validate(
         self, connection: HTTPConnection
     ) -> tuple[AuthCredentials, BaseUser] | None:
@@ -72,19 +196,7 @@ class AAPJWTValidator(AAPBaseValidator):
         )
         if authentication_header_value is None:
             return None
-        try:
-            decryption_key = await self._get_decryption_key()
-        except Exception as exp:
-            logger.error("failed to get the jwt public key: %s", exp)
-            raise AuthenticationError("failed to get the jwt public key")
-
-        try:
-            jwt_token_data = self.decode_jwt_token(
-                authentication_header_value, decryption_key
-            )
-        except Exception as exp:
-            logger.error("failed to decode jwt token: %s", exp)
-            raise AuthenticationError("failed to decode jwt token")
+        jwt_token_data = await self._get_jwt_token_data(authentication_header_value)
 
         username = jwt_token_data["user_data"]["username"]
 
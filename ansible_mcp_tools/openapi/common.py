@@ -3,13 +3,17 @@ from typing import Any
 
 DEFAULT_VERSION_MATCH: str = "^v[1-9]+"
 
+_DEFAULT_VERSION_RE = re.compile(DEFAULT_VERSION_MATCH)
+
 DEFAULT_VERSION_PARAM_NAME: str = "version"
 
+SUPPORTED_METHODS: frozenset[str] = frozenset(("get", "post", "put", "delete", "patch"))
+
 
 def get_spec_default_version(spec: dict[str, Any]) -> str | None:
     version: str | None = None
     info_version: str | None = spec.get("info", {}).get("version", None)
-    if info_version and re.match(DEFAULT_VERSION_MATCH, info_version):
+    if info_version and _DEFAULT_VERSION_RE.match(info_version):
         version = info_version
     return version
 
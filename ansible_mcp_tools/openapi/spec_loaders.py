@@ -1,6 +1,14 @@
 import json
+import random
+import time
 import httpx
-import yaml
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 from typing import override
 from abc import ABC
@@ -20,11 +28,16 @@ class BaseLoader(SpecLoader, ABC):
     def load(self):
         content = self.fetch()
         try:
-            spec = json.loads(content)
+            spec = json_loads(content)
             logger.debug("Content parsed as JSON.")
         except json.JSONDecodeError:
+            # JSON specs never need yaml, so only import it here
+            import yaml
+
+            # CSafeLoader is only available when PyYAML is built with libyaml
+            yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
             try:
-                spec = yaml.safe_load(content)
+                spec = yaml.load(content, Loader=yaml_loader)
                 logger.debug("Content parsed as YAML.")
             except yaml.YAMLError as ye:
                 raise RuntimeError(
@@ -52,23 +65,29 @@ class FileLoader(BaseLoader):
 
 class UrlLoader(BaseLoader):
     retries: int = 3
+    backoff: float = 1.0
 
     @override
     def fetch(self) -> str:
         logger.debug(f"Fetching OpenAPI spec from URL: {self._url}")
-        attempt = 0
-        while attempt < self.retries:
-            try:
-                # This is purposefully synchronous
-                with httpx.Client(verify=False) as client:
+        # This is purposefully synchronous
+        with httpx.Client(verify=False, timeout=30.0) as client:
+            for attempt in range(1, self.retries + 1):
+                try:
                     response = client.get(self._url)
                     response.raise_for_status()
                     return response.text
 
-            except Exception as e:
-                attempt += 1
-                logger.warning(f"Fetch attempt {attempt}/{self.retries} failed: {e}")
+                except Exception as e:
+                    logger.warning(
+                        f"Fetch attempt {attempt}/{self.retries} failed: {e}"
+                    )
+                    if attempt < self.retries:
+                        time.sleep(
+                            min(self.backoff * 2 ** (attempt - 1), 30)
+                            + random.uniform(0, 0.5)
+                        )
 
         raise RuntimeError(
-            f"Failed to fetch spec from {self._url} after {self} attempts."
+            f"Failed to fetch spec from {self._url} after {self.retries} attempts."
         )
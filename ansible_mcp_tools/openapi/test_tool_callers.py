@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the OpenAPI tool callers
+
+Runs tool calls against the bundled controller spec with the HTTP traffic
+served by an httpx mock transport.
+"""
+
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from ansible_mcp_tools import registry, utils
+from ansible_mcp_tools.authentication.auth_user import (
+    AuthenticationInfo,
+    AuthenticationUser,
+)
+from ansible_mcp_tools.authentication.context import auth_context_var
+from ansible_mcp_tools.openapi.tool_callers import DefaultToolCaller
+from ansible_mcp_tools.openapi.tool_name_strategies import DefaultToolNameStrategy
+from ansible_mcp_tools.openapi.tool_parsers import DefaultToolParser
+
+CONTROLLER_SPEC_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    os.pardir,
+    os.pardir,
+    "aap_controller_api_2_5",
+    "aap-controller-api.json",
+)
+
+
+class TestDefaultToolCallerVersionedPaths(unittest.IsolatedAsyncioTestCase):
+    """Test tool calls on the controller paths that carry a {version} placeholder"""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(CONTROLLER_SPEC_PATH) as f:
+            cls.spec = json.load(f)
+        registry.init()
+        registry.register_service_url("gateway", "https://gateway.example.com")
+        registry.register_service_url("controller", "https://controller.example.com")
+
+    def setUp(self):
+        tool_name_strategy = DefaultToolNameStrategy()
+        tools = DefaultToolParser(
+            self.spec, "controller", tool_name_strategy
+        ).parse_tools()
+        self.caller = DefaultToolCaller(
+            self.spec, tools, "controller", tool_name_strategy
+        )
+        self.requests = []
+        self.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self._handle_request)
+        )
+        token = auth_context_var.set(
+            AuthenticationUser(
+                "test",
+                AuthenticationInfo(
+                    "Authorization", "Bearer token", "https://gateway.example.com"
+                ),
+            )
+        )
+        self.addCleanup(auth_context_var.reset, token)
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    def _handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json={"id": 5})
+
+    async def _call(self, name: str, arguments: dict) -> str:
+        with patch.object(utils, "get_http_client", return_value=self.client):
+            result = await self.caller.tool_call(name, arguments)
+        return result[0].text
+
+    async def test_read_without_version_argument(self):
+        """Test that the version comes from the spec, not from the arguments"""
+        text = await self._call(
+            "api_job_templates_read", {"id": 5, "session_id": "abc"}
+        )
+
+        self.assertEqual(json.loads(text), {"text": '{"id":5}'})
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.requests[0].method, "GET")
+        self.assertEqual(
+            str(self.requests[0].url),
+            "https://gateway.example.com/api/controller/v2/job_templates/5/",
+        )
+
+    async def test_list_sends_query_parameters(self):
+        """Test that GET arguments are sent as query parameters"""
+        await self._call("api_job_templates_list", {"page": 2})
+
+        self.assertEqual(
+            str(self.requests[0].url),
+            "https://gateway.example.com/api/controller/v2/job_templates/?page=2",
+        )
+
+    async def test_launch_sends_json_body(self):
+        """Test that non-GET arguments are sent as the JSON body"""
+        await self._call(
+            "api_job_templates_launch_create", {"id": 7, "extra_vars": {"a": 1}}
+        )
+
+        self.assertEqual(self.requests[0].method, "POST")
+        self.assertEqual(
+            str(self.requests[0].url),
+            "https://gateway.example.com/api/controller/v2/job_templates/7/launch/",
+        )
+        self.assertEqual(
+            json.loads(self.requests[0].content), {"id": 7, "extra_vars": {"a": 1}}
+        )
+
+    async def test_response_cookies_are_not_sent_on_next_call(self):
+        """Test that the shared client does not keep cookies between calls"""
+        async_client = httpx.AsyncClient
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(
+                200, json={"id": 5}, headers={"Set-Cookie": "sessionid=userA; Path=/"}
+            )
+
+        def create_client(**kwargs) -> httpx.AsyncClient:
+            return async_client(transport=httpx.MockTransport(handle_request), **kwargs)
+
+        with (
+            patch.dict(utils._http_clients, clear=True),
+            patch.object(httpx, "AsyncClient", create_client),
+        ):
+            try:
+                await self.caller.tool_call("api_job_templates_read", {"id": 5})
+                await self.caller.tool_call("api_job_templates_read", {"id": 6})
+            finally:
+                await utils.close_http_clients()
+
+        self.assertEqual(len(self.requests), 2)
+        self.assertNotIn("cookie", self.requests[1].headers)
+
+    async def test_missing_path_parameter(self):
+        """Test that a missing path parameter is reported without a request"""
+        text = await self._call("api_job_templates_read", {})
+
+        self.assertEqual(text, "Missing parameter: 'id'")
+        self.assertEqual(self.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
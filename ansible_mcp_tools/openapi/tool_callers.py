@@ -1,7 +1,16 @@
 import httpx
 import json
+import re
+import sys
 import mcp.types as types
 
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 from abc import ABC
 from os import environ
 from typing import Dict, List, override
@@ -9,6 +18,7 @@ from typing import Dict, List, override
 from ansible_mcp_tools.registry import get_aap_service, AAPService
 from ansible_mcp_tools.openapi.common import (
     DEFAULT_VERSION_PARAM_NAME,
+    SUPPORTED_METHODS,
     get_spec_default_version,
     get_spec_path_with_version,
 )
@@ -24,6 +34,21 @@ from mcp.server.fastmcp.utilities.logging import get_logger
 
 logger = get_logger(__name__)
 
+# first characters a JSON document (object, array or scalar) can start with
+JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
+# bodies above this size are not fully parsed to check that they are JSON
+JSON_VALIDATION_LIMIT = 256 * 1024
+
+JSON_CLOSING_CHARS = {"{": "}", "[": "]", '"': '"'}
+
+# splitting on this yields alternating static segments and placeholder names
+PATH_PLACEHOLDER_RE = re.compile(r"\{([^}]+)\}")
+
+IGNORED_ARGUMENTS = frozenset({"session_id"})
+
+IGNORED_VERSION_ARGUMENTS = IGNORED_ARGUMENTS | {DEFAULT_VERSION_PARAM_NAME}
+
 
 class BaseToolCaller(ToolCaller, ABC):
     def __init__(
@@ -35,6 +60,7 @@ class BaseToolCaller(ToolCaller, ABC):
     ):
         self._spec = spec
         self._tools = tools
+        self._tool_by_name: Dict[str, types.Tool] = {tool.name: tool for tool in tools}
         self._service_name = service_name
         self._tool_name_strategy = tool_name_strategy
 
@@ -48,19 +74,20 @@ class DefaultToolCaller(BaseToolCaller):
         tool_name_strategy: ToolNameStrategy,
     ):
         super().__init__(spec, tools, service_name, tool_name_strategy)
+        self._operations = self._index_operations()
 
     @override
     async def tool_call(self, name: str, arguments: dict) -> list[types.TextContent]:
         try:
-            logger.debug(f"ToolCaller received CallToolRequest for function: {name}")
-            logger.debug(f"STRIP_PARAM: {environ.get('STRIP_PARAM', '<not set>')}")
-            tool = next((tool for tool in self._tools if tool.name == name), None)
+            logger.debug("ToolCaller received CallToolRequest for function: %s", name)
+            logger.debug("STRIP_PARAM: %s", environ.get("STRIP_PARAM", "<not set>"))
+            tool = self._tool_by_name.get(name)
             if not tool:
                 logger.error(f"Unknown function requested: {name}")
                 return [
                     types.TextContent(type="text", text="Unknown function requested")
                 ]
-            logger.debug(f"Raw arguments before processing: {arguments}")
+            logger.debug("Raw arguments before processing: %s", arguments)
 
             operation_details = self.lookup_operation_details(name)
             if not operation_details:
@@ -81,25 +108,30 @@ class DefaultToolCaller(BaseToolCaller):
             # llama-stack adds a 'session_id' parameter to all calls
             # This leads to remote API invocations failing due to the additional parameter
             # Therefore remove 'session_id' from the arguments dictionary
-            parameters = arguments.copy()
-
-            if "session_id" in parameters:
-                del parameters["session_id"]
-
-            if DEFAULT_VERSION_PARAM_NAME in parameters and ignore_version_path_param:
-                del parameters[DEFAULT_VERSION_PARAM_NAME]
+            excluded_keys = (
+                IGNORED_VERSION_ARGUMENTS
+                if ignore_version_path_param
+                else IGNORED_ARGUMENTS
+            )
+            parameters = {
+                key: value
+                for key, value in arguments.items()
+                if key not in excluded_keys
+            }
 
             try:
-                path = path.format(**parameters)
-                logger.debug(f"Substituted path using format(): {path}")
+                path = "".join(
+                    segment if index % 2 == 0 else str(parameters[segment])
+                    for index, segment in enumerate(operation_details["path_segments"])
+                )
+                logger.debug("Substituted path: %s", path)
                 if method == "GET":
-                    placeholder_keys = [
-                        seg.strip("{}")
-                        for seg in operation_details["original_path"].split("/")
-                        if seg.startswith("{") and seg.endswith("}")
-                    ]
-                    for key in placeholder_keys:
-                        parameters.pop(key, None)
+                    placeholder_keys = operation_details["placeholder_keys"]
+                    parameters = {
+                        key: value
+                        for key, value in parameters.items()
+                        if key not in placeholder_keys
+                    }
             except KeyError as e:
                 logger.error(f"Missing parameter for substitution: {e}")
                 return [types.TextContent(type="text", text=f"Missing parameter: {e}")]
@@ -107,37 +139,21 @@ class DefaultToolCaller(BaseToolCaller):
             request_params = {}
             request_body = None
             if isinstance(parameters, dict):
-                merged_params = []
-                path_item = self._spec.get("paths", {}).get(
-                    operation_details["original_path"], {}
-                )
-                if isinstance(path_item, dict) and "parameters" in path_item:
-                    merged_params.extend(path_item["parameters"])
-                if "parameters" in operation:
-                    merged_params.extend(operation["parameters"])
-                path_params_in_openapi = [
-                    param["name"]
-                    for param in merged_params
-                    if param.get("in") == "path"
+                missing_required = [
+                    param_name
+                    for param_name in operation_details["required_path_params"]
+                    if param_name not in arguments
                 ]
-                if path_params_in_openapi:
-                    missing_required = [
-                        param["name"]
-                        for param in merged_params
-                        if param.get("in") == "path"
-                        and param.get("required", False)
-                        and param["name"] not in arguments
-                    ]
-                    if missing_required:
-                        logger.error(
-                            f"Missing required path parameters: {missing_required}"
+                if missing_required:
+                    logger.error(
+                        f"Missing required path parameters: {missing_required}"
+                    )
+                    return [
+                        types.TextContent(
+                            type="text",
+                            text=f"Missing required path parameters: {missing_required}",
                         )
-                        return [
-                            types.TextContent(
-                                type="text",
-                                text=f"Missing required path parameters: {missing_required}",
-                            )
-                        ]
+                    ]
                 if method == "GET":
                     request_params = parameters
                 else:
@@ -150,7 +166,7 @@ class DefaultToolCaller(BaseToolCaller):
             # Look-up and construct applicable URL
             path = path.lstrip("/")
             service: AAPService = get_aap_service(self._service_name)
-            path = path.lstrip(service.gateway_base_path)
+            path = path.removeprefix(service.gateway_base_path)
 
             auth_user = auth_context_var.get()
             headers = get_authentication_headers()
@@ -164,31 +180,31 @@ class DefaultToolCaller(BaseToolCaller):
             if method != "GET":
                 headers["Content-Type"] = "application/json"
 
-            logger.debug(f"API Request - URL: {api_url}, Method: {method}")
-            logger.debug(f"Headers: {headers}")
-            logger.debug(f"Query Params: {request_params}")
-            logger.debug(f"Request Body: {request_body}")
+            logger.debug("API Request - URL: %s, Method: %s", api_url, method)
+            logger.debug("Headers: %s", headers)
+            logger.debug("Query Params: %s", request_params)
+            logger.debug("Request Body: %s", request_body)
 
             try:
-                async with httpx.AsyncClient(verify=verify_cert) as client:
-                    response = await client.request(
-                        method=method,
-                        url=api_url,
-                        headers=headers,
-                        params=request_params if method == "GET" else None,
-                        json=request_body if method != "GET" else None,
-                    )
-                    response.raise_for_status()
-                    response_text = (response.text or "No response body").strip()
-                    content = self.format_response(response_text)
-                    final_content = [content]
+                client = utils.get_http_client(verify_cert)
+                response = await client.request(
+                    method=method,
+                    url=api_url,
+                    headers=headers,
+                    params=request_params if method == "GET" else None,
+                    json=request_body if method != "GET" else None,
+                )
+                response.raise_for_status()
+                response_text = (response.text or "No response body").strip()
+                content = self.format_response(response_text)
+                final_content = [content]
 
             except httpx.RequestError as e:
                 logger.error(f"API request failed: {e}")
                 return [types.TextContent(type="text", text=str(e))]
 
-            logger.debug(f"Response content type: {content.type}")
-            logger.debug(f"Response sent to client: {content.text}")
+            logger.debug("Response content type: %s", content.type)
+            logger.debug("Response sent to client: %s", content.text)
 
             return final_content
 
@@ -198,46 +214,86 @@ class DefaultToolCaller(BaseToolCaller):
             )
             return [types.TextContent(type="text", text=f"Internal error: {str(e)}")]
 
-    def lookup_operation_details(self, function_name: str) -> Dict or None:
+    def _index_operations(self) -> Dict[str, Dict]:
+        operations: Dict[str, Dict] = {}
         if not self._spec or "paths" not in self._spec:
-            return None
+            return operations
 
         default_spec_version = get_spec_default_version(self._spec)
 
         for path, path_item in self._spec["paths"].items():
+            path, ignore_version_path_param = get_spec_path_with_version(
+                path,
+                default_spec_version,
+                version_param_name=DEFAULT_VERSION_PARAM_NAME,
+            )
+            path_item_params = path_item.get("parameters", [])
             for method, operation in path_item.items():
-                if method.lower() not in ["get", "post", "put", "delete", "patch"]:
+                if method.lower() not in SUPPORTED_METHODS:
                     continue
-                raw_name = f"{self._service_name}_{method.upper()} {path}"
+                merged_params = [*path_item_params, *operation.get("parameters", [])]
                 operation_id = operation.get("operationId", "")
-                current_function_name = utils.get_tool_name_from_operation_id(
-                    operation_id, raw_name, self._tool_name_strategy.normalize_tool_name
-                )
-                path, ignore_version_path_param = get_spec_path_with_version(
-                    path,
-                    default_spec_version,
-                    version_param_name=DEFAULT_VERSION_PARAM_NAME,
+                function_name = utils.get_tool_name_from_operation_id(
+                    operation_id,
+                    lambda: f"{self._service_name}_{method.upper()} {path}",
+                    self._tool_name_strategy.normalize_tool_name,
                 )
-                if current_function_name == function_name:
-                    return {
+                # the first operation registered under a name wins, as in the parser
+                operations.setdefault(
+                    function_name,
+                    {
                         "path": path,
-                        "method": method.upper(),
+                        # interned so the per-call "GET" comparisons hit on identity
+                        "method": sys.intern(method.upper()),
                         "operation": operation,
-                        "original_path": path,
+                        "path_segments": tuple(PATH_PLACEHOLDER_RE.split(path)),
                         "ignore_version_path_param": ignore_version_path_param,
-                    }
-        return None
+                        "placeholder_keys": frozenset(
+                            segment.strip("{}")
+                            for segment in path.split("/")
+                            if segment.startswith("{") and segment.endswith("}")
+                        ),
+                        "required_path_params": tuple(
+                            param["name"]
+                            for param in merged_params
+                            if param.get("in") == "path"
+                            and param.get("required", False)
+                            # the version is filled in from the spec, never by the caller
+                            and not (
+                                ignore_version_path_param
+                                and param["name"] == DEFAULT_VERSION_PARAM_NAME
+                            )
+                        ),
+                    },
+                )
+        return operations
+
+    def lookup_operation_details(self, function_name: str) -> Dict or None:
+        return self._operations.get(function_name)
 
     def format_response(self, response_text: str) -> types.TextContent:
         """Determine response type based on JSON validity.
         If response_text is valid JSON, return a wrapped JSON string;
-        otherwise, return the plain text.
+        otherwise, return the plain text. Bodies larger than JSON_VALIDATION_LIMIT
+        are only checked for matching outer delimiters.
         """
-        try:
-            json.loads(response_text)
-            wrapped_text = json.dumps({"text": response_text})
-            logger.debug("JSON response")
-            return types.TextContent(type="text", text=wrapped_text)
-        except json.JSONDecodeError:
+        stripped_text = response_text.strip()
+        if not stripped_text or stripped_text[0] not in JSON_START_CHARS:
+            logger.debug("Non-JSON text")
+            return types.TextContent(type="text", text=stripped_text)
+        if len(stripped_text) > JSON_VALIDATION_LIMIT:
+            # parsing a large body only to discard the result costs more than
+            # it is worth, check that it is closed the way it was opened
+            is_json = JSON_CLOSING_CHARS.get(stripped_text[0]) == stripped_text[-1]
+        else:
+            try:
+                json_loads(stripped_text)
+                is_json = True
+            except ValueError:
+                is_json = False
+        if not is_json:
             logger.debug("Non-JSON text")
-            return types.TextContent(type="text", text=response_text.strip())
+            return types.TextContent(type="text", text=stripped_text)
+        wrapped_text = json.dumps({"text": response_text})
+        logger.debug("JSON response")
+        return types.TextContent(type="text", text=wrapped_text)
@@ -1,13 +1,27 @@
 import re
 
-import shortuuid
-
 from ansible_mcp_tools.openapi.protocols.tool_name_strategy import ToolNameStrategy
 
 from mcp.server.fastmcp.utilities.logging import get_logger
 
 logger = get_logger(__name__)
 
+_ANTHROPIC_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
+
+_ANTHROPIC_TRANSLATION = str.maketrans({" ": "_", "{": "", "}": "", ",": "_"})
+
+_BRACE_STRIP = str.maketrans("", "", "{}")
+
+_shortuuid = None
+
+
+def _uuid(name: str) -> str:
+    # shortuuid is only needed for operations without a usable operationId
+    global _shortuuid
+    if _shortuuid is None:
+        import shortuuid as _shortuuid
+    return _shortuuid.uuid(name)
+
 
 class DefaultToolNameStrategy(ToolNameStrategy):
     def normalize_tool_name(self, raw_name: str) -> str:
@@ -16,16 +30,8 @@ class DefaultToolNameStrategy(ToolNameStrategy):
             method, path = raw_name.split(" ", 1)
             method = method.lower()
 
-            path_name = ""
-            path_parts = path.split("/")
-            for path_part in path_parts:
-                pp = path_part
-                if pp:
-                    if pp.startswith("{"):
-                        pp = pp[1:]
-                    if pp.endswith("}"):
-                        pp = pp[:-1]
-                    path_name = path_name + "_" + pp if path_name else pp
+            path_parts = path.translate(_BRACE_STRIP).split("/")
+            path_name = "_".join(part for part in path_parts if part)
 
             if not path_parts:
                 return "unknown_tool"
@@ -33,7 +39,7 @@ class DefaultToolNameStrategy(ToolNameStrategy):
             name = f"{method}_{path_name}"
             name = self._anthropic_limitations(name)
 
-            return shortuuid.uuid(name)
+            return _uuid(name)
 
         except ValueError:
             logger.debug(f"Failed to normalize tool name: {raw_name}")
@@ -43,16 +49,11 @@ class DefaultToolNameStrategy(ToolNameStrategy):
         return self._anthropic_limitations(raw_name)
 
     def _anthropic_limitations(self, raw_name: str) -> str:
-        raw_name.replace(" ", "_")
-        raw_name = raw_name.replace("{", "")
-        raw_name = raw_name.replace("}", "")
-        raw_name = raw_name.replace(",", "_")
-        raw_name = raw_name[:63]
+        raw_name = raw_name.translate(_ANTHROPIC_TRANSLATION)[:63]
 
         # This is a nasty assertion to check the correctness raw_name
         # It is useful for debugging.. but could probably be removed.
-        pattern = r"^[a-zA-Z0-9_-]{1,64}$"  # Raw string for regex pattern
-        match = re.search(pattern, raw_name)
+        match = _ANTHROPIC_PATTERN.search(raw_name)
         if not match:
             raise RuntimeWarning(f"Conversion of {raw_name} did not pass checks.")
         return raw_name
@@ -1,7 +1,19 @@
 import json
+import logging
+import re
 import mcp.types as types
 
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    json_dumps = json.dumps
+
 from abc import ABC
+from functools import lru_cache
 from typing import Dict, List, override
 
 from ansible_mcp_tools.openapi.protocols.tool_parser import ToolParser
@@ -12,14 +24,24 @@ from mcp.server.fastmcp.utilities.logging import get_logger
 from ansible_mcp_tools import utils
 from ansible_mcp_tools.openapi.common import (
     DEFAULT_VERSION_PARAM_NAME,
+    SUPPORTED_METHODS,
     get_spec_default_version,
     get_spec_path_with_version,
 )
 from ansible_mcp_tools.openapi.protocols.tool_rule import ToolRule
-from ansible_mcp_tools.openapi.tool_rules import check_tool_rules
+from ansible_mcp_tools.openapi.tool_rules import check_tool_rules, split_tool_rules
 
 logger = get_logger(__name__)
 
+# matches path segments that are entirely a {placeholder}
+PATH_PLACEHOLDER_RE = re.compile(r"(?<![^/])\{([^/{}]+)\}(?![^/])")
+
+# only these parameters become tool inputs, header and cookie ones are skipped
+INPUT_PARAMETER_LOCATIONS = frozenset(("path", "query"))
+
+# any other parameter schema type is exposed as a string
+INPUT_SCHEMA_TYPES = frozenset(("string", "integer", "boolean", "number"))
+
 
 class BaseToolParser(ToolParser, ABC):
     def __init__(
@@ -32,9 +54,17 @@ class BaseToolParser(ToolParser, ABC):
         if tool_rules is None:
             tool_rules = []
         self._tool_rules = tool_rules
+        self._include_rules, self._deny_rules = split_tool_rules(tool_rules)
         self._spec = spec
         self._service_name = service_name
         self._tool_name_strategy = tool_name_strategy
+        # names repeat heavily across a spec, normalize each distinct one once
+        self._normalize_tool_name = lru_cache(maxsize=4096)(
+            tool_name_strategy.normalize_tool_name
+        )
+        self._normalize_tool_parameter_name = lru_cache(maxsize=4096)(
+            tool_name_strategy.normalize_tool_parameter_name
+        )
 
 
 class DefaultToolParser(BaseToolParser):
@@ -51,6 +81,7 @@ class DefaultToolParser(BaseToolParser):
     def parse_tools(self) -> List[types.Tool]:
         """Register tools from OpenAPI spec, preserving across calls if already populated."""
         tools: List[types.Tool] = []
+        seen_names: set[str] = set()
         logger.debug("Clearing previously registered tools to allow re-registration")
         tools.clear()
         tools_ignored = 0
@@ -61,14 +92,14 @@ class DefaultToolParser(BaseToolParser):
             logger.error("No 'paths' key in OpenAPI spec.")
             return tools
 
-        logger.debug(f"Spec paths available: {list(self._spec['paths'].keys())}")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Spec paths available: {list(self._spec['paths'].keys())}")
         default_spec_version = get_spec_default_version(self._spec)
 
-        paths = {path: item for path, item in self._spec["paths"].items()}
-        logger.debug(f"Paths: {list(paths.keys())}")
-        for path, path_item in paths.items():
+        for path, path_item in self._spec["paths"].items():
             if not path_item:
-                logger.debug(f"Empty path item for {path}")
+                logger.debug("Empty path item for %s", path)
                 continue
 
             path, ignore_version_path_param = get_spec_path_with_version(
@@ -76,37 +107,48 @@ class DefaultToolParser(BaseToolParser):
                 default_spec_version,
                 version_param_name=DEFAULT_VERSION_PARAM_NAME,
             )
+            try:
+                placeholder_params = [
+                    self._normalize_tool_parameter_name(param_name)
+                    for param_name in PATH_PLACEHOLDER_RE.findall(path)
+                ]
+            except Exception as e:
+                logger.error(
+                    f"Error registering functions for {path}: {e}", exc_info=True
+                )
+                continue
 
             for method, operation in path_item.items():
+                # rule out path level keys (parameters, summary, x-*) before
+                # running the tool rules against them
+                if method.lower() not in SUPPORTED_METHODS:
+                    logger.debug("Skipping unsupported method %s for %s", method, path)
+                    tools_ignored += 1
+                    continue
                 if not isinstance(operation, dict) or not check_tool_rules(
-                    self._tool_rules, path, method, operation
+                    self._include_rules, self._deny_rules, path, method, operation
                 ):
                     logger.debug(
-                        f"Skipping unsupported path operation item, path: {path}, method: {method}, operation: {operation}"
+                        "Skipping unsupported path operation item, path: %s, method: %s, operation: %s",
+                        path,
+                        method,
+                        operation,
                     )
                     tools_ignored += 1
                     continue
-                if method.lower() not in ["get", "post", "put", "delete", "patch"]:
-                    logger.debug(f"Skipping unsupported method {method} for {path}")
-                    tools_ignored += 1
-                    continue
+                http_method = method.upper()
                 try:
-                    raw_name = f"{self._service_name}_{method.upper()} {path}"
                     operation_id = operation.get("operationId", "")
                     function_name = utils.get_tool_name_from_operation_id(
                         operation_id,
-                        raw_name,
-                        self._tool_name_strategy.normalize_tool_name,
+                        lambda: f"{self._service_name}_{http_method} {path}",
+                        self._normalize_tool_name,
                     )
 
-                    tool_exists = False
-                    for tool in tools:
-                        if tool.name == function_name:
-                            tool_exists = True
-                            logger.warning(
-                                f"Function: {function_name} already exists. Skipping."
-                            )
-                    if tool_exists:
+                    if function_name in seen_names:
+                        logger.warning(
+                            "Function: %s already exists. Skipping.", function_name
+                        )
                         continue
 
                     description = operation.get("summary", "")
@@ -122,80 +164,77 @@ class DefaultToolParser(BaseToolParser):
                         if not description:
                             description = operation_id or function_name
 
-                    input_schema = {
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                        "additionalProperties": False,
-                    }
+                    properties = {}
+                    required = []
+                    required_set = set()
                     parameters = operation.get("parameters", [])
-                    placeholder_params = [
-                        part.strip("{}")
-                        for part in path.split("/")
-                        if "{" in part and "}" in part
-                    ]
                     for param_name in placeholder_params:
-                        param_name = (
-                            self._tool_name_strategy.normalize_tool_parameter_name(
-                                param_name
-                            )
-                        )
-                        input_schema["properties"][param_name] = {
+                        properties[param_name] = {
                             "type": "string",
                             "description": f"Path parameter {param_name}",
                         }
-                        input_schema["required"].append(param_name)
+                        required.append(param_name)
+                        required_set.add(param_name)
                         logger.debug(
-                            f"Added URI placeholder {param_name} to inputSchema for {function_name}"
+                            "Added URI placeholder %s to inputSchema for %s",
+                            param_name,
+                            function_name,
                         )
                     for param in parameters:
+                        param_in = param.get("in")
+                        if param_in not in INPUT_PARAMETER_LOCATIONS:
+                            continue
                         param_name = param.get("name")
-                        param_name = (
-                            self._tool_name_strategy.normalize_tool_parameter_name(
-                                param_name
-                            )
+                        if not param_name:
+                            continue
+                        if (
+                            param_in == "path"
+                            and param_name == DEFAULT_VERSION_PARAM_NAME
+                            and ignore_version_path_param
+                        ):
+                            continue
+                        param_name = self._normalize_tool_parameter_name(param_name)
+
+                        param_type = param.get("schema", {}).get("type", "string")
+                        schema_type = (
+                            param_type if param_type in INPUT_SCHEMA_TYPES else "string"
                         )
-                        param_in = param.get("in")
-                        if param_in in ["path", "query"]:
-                            if (
-                                param_in == "path"
-                                and param_name == DEFAULT_VERSION_PARAM_NAME
-                                and ignore_version_path_param
-                            ):
-                                continue
-
-                            param_type = param.get("schema", {}).get("type", "string")
-                            schema_type = (
-                                param_type
-                                if param_type
-                                in ["string", "integer", "boolean", "number"]
-                                else "string"
-                            )
-                            input_schema["properties"][param_name] = {
-                                "type": schema_type,
-                                "description": param.get(
-                                    "description", f"{param_in} parameter {param_name}"
-                                ),
-                            }
-                            if (
-                                param.get("required", False)
-                                and param_name not in input_schema["required"]
-                            ):
-                                input_schema["required"].append(param_name)
+                        if "description" in param:
+                            param_description = param["description"]
+                        else:
+                            param_description = f"{param_in} parameter {param_name}"
+                        properties[param_name] = {
+                            "type": schema_type,
+                            "description": param_description,
+                        }
+                        if (
+                            param.get("required", False)
+                            and param_name not in required_set
+                        ):
+                            required.append(param_name)
+                            required_set.add(param_name)
+                    input_schema = {
+                        "type": "object",
+                        "properties": properties,
+                        "required": required,
+                        "additionalProperties": False,
+                    }
                     tool = types.Tool(
                         name=function_name,
                         description=description,
                         inputSchema=input_schema,
                     )
                     tools.append(tool)
-                    logger.debug(
-                        f"Registered function: {function_name} ({method.upper()} {path}) with inputSchema: {json.dumps(input_schema)}"
-                    )
+                    seen_names.add(function_name)
+                    if debug_enabled:
+                        logger.debug(
+                            f"Registered function: {function_name} ({http_method} {path}) with inputSchema: {json_dumps(input_schema)}"
+                        )
                 except Exception as e:
                     logger.error(
-                        f"Error registering function for {method.upper()} {path}: {e}",
+                        f"Error registering function for {http_method} {path}: {e}",
                         exc_info=True,
                     )
-        logger.debug(f"Registered {len(tools)} functions from OpenAPI spec.")
-        logger.debug(f"Ignored {tools_ignored} functions from OpenAPI spec.")
+        logger.debug("Registered %s functions from OpenAPI spec.", len(tools))
+        logger.debug("Ignored %s functions from OpenAPI spec.", tools_ignored)
         return tools
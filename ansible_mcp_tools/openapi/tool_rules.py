@@ -11,8 +11,8 @@ class MethodRule(ToolRule):
         if not isinstance(black_list_methods, list):
             black_list_methods = []
 
-        self._black_list_methods = list(
-            map(lambda item: item.lower(), black_list_methods)
+        self._black_list_methods = frozenset(
+            item.lower() for item in black_list_methods
         )
 
     def check(self, path: str, method: str, method_operation: dict[str:Any]) -> bool:
@@ -25,7 +25,7 @@ class OperationIdWhiteRule(ToolRule):
     include_any = True
 
     def __init__(self, white_list_operations: list[str]):
-        self._white_list_operations = white_list_operations
+        self._white_list_operations = frozenset(white_list_operations)
 
     def check(self, path: str, method: str, method_operation: dict[str:Any]) -> bool:
         operation_id = method_operation.get("operationId", "")
@@ -36,7 +36,7 @@ class OperationIdWhiteRule(ToolRule):
 
 class OperationIdBlackRule(ToolRule):
     def __init__(self, black_list: list[str]):
-        self._black_list = black_list
+        self._black_list = frozenset(black_list)
 
     def check(self, path: str, method: str, method_operation: dict[str:Any]) -> bool:
         operation_id = method_operation.get("operationId", "")
@@ -47,7 +47,7 @@ class OperationIdBlackRule(ToolRule):
 
 class PathRule(ToolRule):
     def __init__(self, black_list_paths: list[str]):
-        self._black_list_paths = black_list_paths
+        self._black_list_paths = frozenset(black_list_paths)
 
     def check(self, path: str, method: str, method_operation: dict[str:Any]) -> bool:
         if path in self._black_list_paths:
@@ -64,20 +64,31 @@ class NoDescriptionRule(ToolRule):
         return True
 
 
+def split_tool_rules(
+    tool_rules: list[ToolRule],
+) -> tuple[tuple[ToolRule, ...], tuple[ToolRule, ...]]:
+    include_rules = tuple(
+        tool_rule for tool_rule in tool_rules if tool_rule.include_any
+    )
+    deny_rules = tuple(
+        tool_rule for tool_rule in tool_rules if not tool_rule.include_any
+    )
+    return include_rules, deny_rules
+
+
 def check_tool_rules(
-    tool_rules: list[ToolRule], path: str, method: str, method_operation: dict[str:Any]
+    include_rules: tuple[ToolRule, ...],
+    deny_rules: tuple[ToolRule, ...],
+    path: str,
+    method: str,
+    method_operation: dict[str:Any],
 ) -> bool:
-    valid = True
-    for tool_rule in tool_rules:
-        check = tool_rule.check(path, method, method_operation)
-        if tool_rule.include_any:
-            if check:
-                valid = True
-                break
-        else:
-            if not check:
-                valid = False
-                # do not break to check all the rules,
-                # because maybe a white rule with include_any True is ahead of the list
-
-    return valid
+    # a tool passing any include_any rule is valid whatever the other rules say,
+    # otherwise it has to pass all of them
+    if any(
+        tool_rule.check(path, method, method_operation) for tool_rule in include_rules
+    ):
+        return True
+    return all(
+        tool_rule.check(path, method, method_operation) for tool_rule in deny_rules
+    )
@@ -2,6 +2,8 @@ from urllib.parse import urljoin
 
 from dataclasses import dataclass
 
+from functools import lru_cache
+
 
 @dataclass
 class AAPService:
@@ -17,6 +19,7 @@ _aap_services_registry: dict[str:AAPService] = {}
 
 def register_service_url(name: str, service_url: str) -> None:
     _hosts_registry[name] = service_url
+    get_aap_service_url_base_path.cache_clear()
 
 
 def get_service_url(name: str) -> str | None:
@@ -25,6 +28,7 @@ def get_service_url(name: str) -> str | None:
 
 def register_aap_service(service: AAPService) -> None:
     _aap_services_registry[service.name] = service
+    get_aap_service_url_base_path.cache_clear()
 
 
 def get_aap_service(name: str) -> AAPService | None:
@@ -55,6 +59,8 @@ def register_aap_services():
     )
 
 
+# registrations only change at startup, the cache is cleared whenever they do
+@lru_cache(maxsize=32)
 def get_aap_service_url_base_path(service_name: str, context: str = None) -> str | None:
     service_url = get_service_url(service_name)
     if service_url is None:
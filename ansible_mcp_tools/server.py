@@ -1,5 +1,7 @@
 import mcp.types as types
 
+from contextlib import asynccontextmanager
+
 from ansible_mcp_tools.authentication.protocols.backend import AuthenticationBackend
 from ansible_mcp_tools.authentication.middleware import (
     LightspeedAuthenticationMiddleware,
@@ -11,6 +13,7 @@ from ansible_mcp_tools.openapi.protocols.tool_rule import ToolRule
 from ansible_mcp_tools.openapi.tool_parsers import DefaultToolParser
 from ansible_mcp_tools.openapi.tool_callers import DefaultToolCaller
 from ansible_mcp_tools.openapi.tool_name_strategies import DefaultToolNameStrategy
+from ansible_mcp_tools import utils
 from collections.abc import Sequence
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.utilities.logging import get_logger
@@ -42,16 +45,31 @@ class LightspeedBaseAAPServer(FastMCP):
                 LightspeedAuthenticationMiddleware, backend=self._auth_backend
             )
 
+    def init_app_http_clients(self, app: Starlette):
+        lifespan = app.router.lifespan_context
+
+        @asynccontextmanager
+        async def _lifespan(app: Starlette):
+            try:
+                async with lifespan(app) as state:
+                    yield state
+            finally:
+                await utils.close_http_clients()
+
+        app.router.lifespan_context = _lifespan
+
     @override
     def sse_app(self, mount_path: str | None = None) -> Starlette:
         app = super().sse_app(mount_path=mount_path)
         self.init_app_authentication_backend(app)
+        self.init_app_http_clients(app)
         return app
 
     @override
     def streamable_http_app(self) -> Starlette:
         app = super().streamable_http_app()
         self.init_app_authentication_backend(app)
+        self.init_app_http_clients(app)
         return app
 
 
@@ -1,8 +1,44 @@
+import re
+
+import httpx
+
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
 from typing import Callable
 from ansible_mcp_tools import registry
 
 AAP_JWT_HEADER_NAME = "X-DAB-JW-TOKEN"
 
+_API_PREFIX_RE = re.compile(r"^/?api/")
+
+_http_clients: dict[bool, httpx.AsyncClient] = {}
+
+
+class _RejectCookiesPolicy(DefaultCookiePolicy):
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+
+def get_http_client(verify: bool) -> httpx.AsyncClient:
+    client = _http_clients.get(verify)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            verify=verify,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=30.0,
+            # the client is shared between users, never carry cookies from one
+            # response over to the next request
+            cookies=CookieJar(policy=_RejectCookiesPolicy()),
+        )
+        _http_clients[verify] = client
+    return client
+
+
+async def close_http_clients():
+    while _http_clients:
+        _, client = _http_clients.popitem()
+        await client.aclose()
+
 
 def get_aap_service_url_base_path_by_header_name(
     service_name: str, auth_header_name: str
@@ -20,20 +56,17 @@ def get_aap_service_url_path(
     )
     if base_url_path is None:
         return None
-    for text in ("api/", "/api/"):
-        if path.startswith(text):
-            path = path[len(text) :]
-            break
-
-    if path.startswith("/"):
-        path = path[1:]
+    path = _API_PREFIX_RE.sub("", path, count=1).removeprefix("/")
 
     return f"{base_url_path}/{path}"
 
 
 def get_tool_name_from_operation_id(
-    operation_id: str, raw_name: str, normalization_function: Callable[[str], str]
+    operation_id: str,
+    get_raw_name: Callable[[], str],
+    normalization_function: Callable[[str], str],
 ) -> str:
+    # the raw name is only built when the operation id cannot be used as is
     if 0 < len(operation_id) <= 64:
         return operation_id
-    return normalization_function(raw_name)
+    return normalization_function(get_raw_name())